@@ -216,6 +216,35 @@ class BuildingBlocksManager:
         self.logger.info(f"🎲 Generated {len(blocks)} random blocks from category '{category}'")
         return blocks
 
+    def get_random_blocks_by_category(self, categories: List[str], count: int = 10,
+                                      novel_title: str = None) -> Dict[str, List[str]]:
+        """Get random building blocks for several categories in one query"""
+
+        match = {"category": {"$in": categories}, "type": {"$ne": "extraction_summary"}}
+        if novel_title:
+            match["source.novel_title"] = novel_title
+
+        # One $sample per category, run side by side by $facet
+        pipeline = [
+            {"$match": match},
+            {"$facet": {
+                category: [
+                    {"$match": {"category": category}},
+                    {"$sample": {"size": count}},
+                    {"$project": {"block": 1, "_id": 0}}
+                ]
+                for category in categories
+            }}
+        ]
+
+        facets = next(self.collection.aggregate(pipeline), {})
+        blocks = {category: [doc["block"] for doc in facets.get(category, [])]
+                  for category in categories}
+
+        self.logger.info(f"🎲 Generated {sum(map(len, blocks.values()))} random blocks "
+                         f"from {len(categories)} categories")
+        return blocks
+
     def get_statistics(self) -> Dict[str, Any]:
         """Get building blocks collection statistics"""
 
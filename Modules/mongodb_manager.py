@@ -5,6 +5,7 @@ MongoDB connection and collection management for AI-Powered Extraction v3
 """
 
 import os
+import warnings
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any, Tuple
 
@@ -20,11 +21,12 @@ except ImportError:
 # Try to import pymongo
 try:
     from pymongo import MongoClient
-    from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
+    from pymongo.errors import BulkWriteError, ConnectionFailure, ServerSelectionTimeoutError
     PYMONGO_AVAILABLE = True
 except ImportError:
     PYMONGO_AVAILABLE = False
     MongoClient = None
+    BulkWriteError = Exception
     ConnectionFailure = Exception
     ServerSelectionTimeoutError = Exception
 
@@ -36,6 +38,26 @@ MONGODB_USERNAME = os.getenv("MONGODB_USERNAME")
 MONGODB_PASSWORD = os.getenv("MONGODB_PASSWORD")
 MONGODB_CONNECTION_STRING = os.getenv("MONGODB_CONNECTION_STRING")
 
+# Connection pool - sized for batch tools that issue many concurrent bulk writes
+MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", "200"))
+MONGODB_MIN_POOL_SIZE = int(os.getenv("MONGODB_MIN_POOL_SIZE", "10"))
+MONGODB_MAX_IDLE_TIME_MS = int(os.getenv("MONGODB_MAX_IDLE_TIME_MS", "300000"))
+
+# Wire compression - content documents are mostly natural text and compress well
+MONGODB_COMPRESSORS = os.getenv("MONGODB_COMPRESSORS", "zstd,snappy,zlib")
+MONGODB_ZLIB_COMPRESSION_LEVEL = int(os.getenv("MONGODB_ZLIB_COMPRESSION_LEVEL", "6"))
+
+def _supported_compressors(compressors: str) -> str:
+    """Drop compressors whose support library is not installed (zlib is always available)"""
+    try:
+        from pymongo.compression_support import validate_compressors
+    except ImportError:
+        return compressors
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        return ",".join(validate_compressors(None, compressors))
+
 # Build connection string if not provided
 if not MONGODB_CONNECTION_STRING:
     if MONGODB_USERNAME and MONGODB_PASSWORD:
@@ -49,7 +71,11 @@ MONGODB_CONFIG = {
     "database": MONGODB_DATABASE,
     "username": MONGODB_USERNAME,
     "password": MONGODB_PASSWORD,
-    "connection_string": MONGODB_CONNECTION_STRING
+    "connection_string": MONGODB_CONNECTION_STRING,
+    "max_pool_size": MONGODB_MAX_POOL_SIZE,
+    "min_pool_size": MONGODB_MIN_POOL_SIZE,
+    "max_idle_time_ms": MONGODB_MAX_IDLE_TIME_MS,
+    "compressors": MONGODB_COMPRESSORS
 }
 
 class MongoDBManager:
@@ -74,12 +100,25 @@ class MongoDBManager:
             if self.debug:
                 print(f"🔌 Connecting to MongoDB: {MONGODB_HOST}:{MONGODB_PORT}")
 
-            # Create client with timeout
+            compressors = _supported_compressors(MONGODB_COMPRESSORS)
+            compression = {}
+            if compressors:
+                compression = {
+                    "compressors": compressors,
+                    "zlibCompressionLevel": MONGODB_ZLIB_COMPRESSION_LEVEL
+                }
+
+            # Create client with timeout, a persistent connection pool and wire compression
             self.client = MongoClient(
                 MONGODB_CONNECTION_STRING,
                 serverSelectionTimeoutMS=5000,  # 5 second timeout
                 connectTimeoutMS=5000,
-                socketTimeoutMS=5000
+                socketTimeoutMS=5000,
+                maxPoolSize=MONGODB_MAX_POOL_SIZE,
+                minPoolSize=MONGODB_MIN_POOL_SIZE,
+                maxIdleTimeMS=MONGODB_MAX_IDLE_TIME_MS,
+                retryWrites=True,
+                **compression
             )
 
             # Test connection
@@ -91,6 +130,7 @@ class MongoDBManager:
 
             if self.debug:
                 print(f"✅ Connected to MongoDB database: {MONGODB_DATABASE}")
+                print(f"🗜️  Wire compression: {compressors or 'disabled'}")
 
             return True
 
@@ -295,6 +335,132 @@ class MongoDBManager:
                 print(f"❌ {error_msg}")
             return False, error_msg
 
+    def find_cursor(self, collection_name: str, query: Optional[Dict[str, Any]] = None,
+                    projection: Optional[Dict[str, Any]] = None, batch_size: int = 100):
+        """Open a server-side cursor that streams documents in batches
+
+        Keeps memory bounded by batch_size instead of materializing the
+        whole result set. The cursor does not time out on the server, so
+        callers should close it (or use it as a context manager).
+        """
+        if not self.connected:
+            return None
+
+        return self.database[collection_name].find(
+            query or {}, projection, no_cursor_timeout=True
+        ).batch_size(batch_size)
+
+    def bulk_write(self, collection_name: str, operations: List[Any],
+                   ordered: bool = False) -> Dict[str, Any]:
+        """Apply a list of pymongo write operations in a single round trip
+
+        Args:
+            collection_name: Target MongoDB collection
+            operations: pymongo operations (UpdateOne, InsertOne, ...)
+            ordered: If False (default), the server may apply operations in
+                     parallel and keeps going past individual failures
+
+        When some operations fail, the counts of those that were applied are
+        returned alongside the error.
+        """
+        if not self.connected:
+            return {'success': False, 'error': 'Database not connected'}
+
+        if not operations:
+            return {'success': True, 'matched': 0, 'modified': 0, 'inserted': 0, 'upserted': 0}
+
+        try:
+            result = self.database[collection_name].bulk_write(operations, ordered=ordered)
+
+            if self.debug:
+                print(f"✅ Bulk write to '{collection_name}': {result.modified_count} modified, "
+                      f"{result.inserted_count} inserted")
+
+            return {
+                'success': True,
+                'matched': result.matched_count,
+                'modified': result.modified_count,
+                'inserted': result.inserted_count,
+                'upserted': result.upserted_count
+            }
+
+        except BulkWriteError as e:
+            details = e.details
+            error_msg = f"Bulk write failed: {len(details.get('writeErrors', []))} operations failed"
+            if self.debug:
+                print(f"❌ {error_msg}")
+            return {
+                'success': False,
+                'error': error_msg,
+                'matched': details.get('nMatched', 0),
+                'modified': details.get('nModified', 0),
+                'inserted': details.get('nInserted', 0),
+                'upserted': details.get('nUpserted', 0)
+            }
+
+        except Exception as e:
+            error_msg = f"Bulk write failed: {str(e)}"
+            if self.debug:
+                print(f"❌ {error_msg}")
+            return {'success': False, 'error': error_msg}
+
+    def update_many(self, collection_name: str, query: Dict[str, Any],
+                    update: Any) -> Dict[str, Any]:
+        """Update every matching document server-side in a single round trip
+
+        Args:
+            collection_name: Target MongoDB collection
+            query: Filter selecting the documents to update
+            update: Update document, or an aggregation pipeline (list of stages)
+                    so new values can be computed from existing fields
+        """
+        if not self.connected:
+            return {'success': False, 'error': 'Database not connected'}
+
+        try:
+            result = self.database[collection_name].update_many(query, update)
+
+            if self.debug:
+                print(f"✅ Updated {result.modified_count} documents in '{collection_name}'")
+
+            return {
+                'success': True,
+                'matched': result.matched_count,
+                'modified': result.modified_count
+            }
+
+        except Exception as e:
+            error_msg = f"Update failed: {str(e)}"
+            if self.debug:
+                print(f"❌ {error_msg}")
+            return {'success': False, 'error': error_msg}
+
+    def create_index(self, collection_name: str, keys: List[Tuple[str, int]],
+                     **kwargs) -> Dict[str, Any]:
+        """Create an index on a collection (a no-op if it already exists)
+
+        Args:
+            collection_name: Target MongoDB collection
+            keys: (field, direction) pairs, e.g. [('metadata.quality_score', 1)]
+            **kwargs: Extra index options passed to pymongo (name, sparse, ...)
+        """
+        if not self.connected:
+            return {'success': False, 'error': 'Database not connected'}
+
+        try:
+            index_name = self.database[collection_name].create_index(keys, **kwargs)
+
+            if self.debug:
+                print(f"✅ Index '{index_name}' ready on '{collection_name}'")
+
+            return {'success': True, 'index_name': index_name}
+
+        except Exception as e:
+            error_msg = f"Index creation failed: {str(e)}"
+            if self.debug:
+                print(f"❌ {error_msg}")
+            return {'success': False, 'error': error_msg}
+
     def _extract_tags(self, content: str) -> List[str]:
         """Extract simple tags from content for v1/v2 compatibility"""
         if not content:
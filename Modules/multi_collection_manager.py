@@ -384,9 +384,10 @@ class MultiGameCollectionManager:
                 results = response.json()
                 documents = results.get('documents', [])
                 metadatas = results.get('metadatas', [])
+                doc_ids = results.get('ids') or [None] * len(documents)
 
                 found_docs = []
-                for doc, metadata in zip(documents, metadatas):
+                for doc_id, doc, metadata in zip(doc_ids, documents, metadatas):
                     if doc:
                         # Add game metadata
                         enhanced_metadata = metadata.copy()
@@ -398,6 +399,7 @@ class MultiGameCollectionManager:
                         })
 
                         found_docs.append({
+                            "id": doc_id,
                             "content": doc,
                             "metadata": enhanced_metadata,
                             "collection": collection_name
@@ -412,6 +414,50 @@ class MultiGameCollectionManager:
             print(f"❌ Browse error: {e}")
             return []
 
+    def get_documents(self, collection_name: str, ids: List[str]) -> List[Dict]:
+        """Fetch specific documents by ID from a collection in one request"""
+        if collection_name not in self.collections:
+            print(f"❌ Collection '{collection_name}' not found")
+            return []
+
+        if not ids:
+            return []
+
+        collection_uuid = self.collections[collection_name]
+
+        try:
+            get_url = f"{self.base_url}/collections/{collection_uuid}/get"
+            payload = {
+                "ids": list(ids),
+                "include": ["documents", "metadatas"]
+            }
+
+            response = requests.post(get_url, json=payload)
+
+            if response.status_code == 200:
+                results = response.json()
+                doc_ids = results.get('ids', [])
+                documents = results.get('documents', [])
+                metadatas = results.get('metadatas') or [None] * len(doc_ids)
+
+                return [
+                    {
+                        "id": doc_id,
+                        "content": doc,
+                        "metadata": metadata or {},
+                        "collection": collection_name
+                    }
+                    for doc_id, doc, metadata in zip(doc_ids, documents, metadatas)
+                    if doc
+                ]
+            else:
+                print(f"❌ Get failed: {response.status_code}")
+                return []
+
+        except Exception as e:
+            print(f"❌ Get error: {e}")
+            return []
+
     def search_with_game_filter(self, query: str, game_type: Optional[str] = None,
                                edition: Optional[str] = None, book: Optional[str] = None,
                                n_results: int = 3) -> Dict[str, List[Dict]]:
@@ -29,6 +29,51 @@ try:
 except ImportError:
     NLTK_AVAILABLE = False
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Patterns used on every assessed/cleaned text, compiled once at import
+_RE_NON_WORD = re.compile(r'[^\w]')
+_RE_LEADING_PUNCT = re.compile(r'^[^\w]*')
+_RE_TRAILING_PUNCT = re.compile(r'[^\w]*$')
+_RE_WHITESPACE = re.compile(r'\s+')
+_RE_EXCESS_NEWLINES = re.compile(r'\n\s*\n\s*\n+')
+_RE_SPACE_BEFORE_PUNCT = re.compile(r'\s+([,.!?;:])')
+_RE_SENTENCE_SPACING = re.compile(r'([.!?])\s*([A-Z])')
+_RE_SENTENCE_SPLIT = re.compile(r'[.!?]+')
+_RE_EXCESS_WHITESPACE = re.compile(r'\s{3,}')
+_RE_SPACED_LETTERS = re.compile(r'([a-z])\s+([a-z])')
+_RE_SMART_QUOTES = re.compile(r'[\u201c\u201d\u201e]')
+_RE_SMART_APOSTROPHES = re.compile(r'[\u2018\u2019\u201a]')
+_RE_SMART_QUOTE_CHARS = re.compile('[\u201c\u201d\u201e\u2018\u2019\u201a]')  # literal chars, also valid for hyperscan
+
+# Pattern-based issues reported by _identify_text_issues, in report order
+_TEXT_ISSUE_PATTERNS = (
+    (_RE_EXCESS_WHITESPACE, "Excessive whitespace detected"),
+    (_RE_SPACED_LETTERS, "Spaced letters within words (OCR artifact)"),
+    (_RE_SMART_QUOTE_CHARS, "Smart quotes/apostrophes detected"),
+)
+
+# Python's \s for str (every char where str.isspace(), all in the BMP) as an
+# explicit class, so hyperscan's \s can't differ from re's (e.g. on \x1c-\x1f)
+_HS_WHITESPACE_CLASS = '[' + ''.join(
+    f'\\x{{{code:x}}}' for code in range(0x10000) if chr(code).isspace()
+) + ']'
+
+# Common OCR artifacts counted by the character quality score
+_OCR_ARTIFACT_PATTERNS = (
+    re.compile(r'\b0\b(?![0-9])'),  # Standalone zeros (likely O)
+    re.compile(r'\bl\b(?![a-z])'),  # Standalone l (likely I)
+    re.compile(r'rn(?=[a-z])'),     # rn that should be m
+    _RE_SMART_QUOTES,               # Smart quotes
+    _RE_SMART_APOSTROPHES,          # Smart apostrophes
+    re.compile(r'\s{2,}'),          # Multiple spaces
+    _RE_SPACED_LETTERS,             # Spaced letters within words
+)
+
 @dataclass
 class QualityMetrics:
     """Quality assessment metrics for text"""
@@ -70,10 +115,13 @@ class TextQualityEnhancer:
             self.logger.warning("pyspellchecker not available - spell checking disabled")
 
         # OCR artifact patterns
-        self.ocr_patterns = self._build_ocr_cleanup_patterns()
+        self.ocr_patterns = self._compile_patterns(self._build_ocr_cleanup_patterns())
 
         # RPG-specific patterns
-        self.rpg_patterns = self._build_rpg_patterns()
+        self.rpg_patterns = self._compile_patterns(self._build_rpg_patterns())
+
+        # Multi-pattern issue scanner (falls back to one re.search per pattern)
+        self.issue_scanner = self._build_issue_scanner()
 
     def _load_rpg_dictionary(self):
         """Load RPG-specific terms into spell checker"""
@@ -121,6 +169,48 @@ class TextQualityEnhancer:
                 # Also add capitalized versions
                 self.spell_checker.word_frequency.load_words([term.capitalize()])
 
+    @staticmethod
+    def _compile_patterns(patterns: List[Tuple[str, str]]) -> List[Tuple[re.Pattern, str]]:
+        """Compile (pattern, replacement) pairs once so cleanup doesn't re-parse them per text"""
+        return [(re.compile(pattern), replacement) for pattern, replacement in patterns]
+
+    def _build_issue_scanner(self):
+        """Compile the issue patterns into a single hyperscan database, if available"""
+        if not HYPERSCAN_AVAILABLE:
+            return None
+
+        try:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[pattern.pattern.replace(r'\s', _HS_WHITESPACE_CLASS).encode('utf-8')
+                             for pattern, _ in _TEXT_ISSUE_PATTERNS],
+                ids=list(range(len(_TEXT_ISSUE_PATTERNS))),
+                elements=len(_TEXT_ISSUE_PATTERNS),
+                flags=[hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH]
+                * len(_TEXT_ISSUE_PATTERNS),
+            )
+            return database
+        except Exception as e:
+            self.logger.warning(f"hyperscan compile failed, using re for issue detection: {e}")
+            return None
+
+    def _scan_text_issues(self, text: str) -> List[str]:
+        """Return the labels of every issue pattern found in text, in report order"""
+        if self.issue_scanner is None:
+            return [label for pattern, label in _TEXT_ISSUE_PATTERNS if pattern.search(text)]
+
+        matched = set()
+
+        def on_match(pattern_id, start, end, flags, context):
+            matched.add(pattern_id)
+
+        try:
+            self.issue_scanner.scan(text.encode('utf-8'), match_event_handler=on_match)
+        except (UnicodeEncodeError, hyperscan.error):
+            # e.g. lone surrogates from PDF text, which only re can search
+            return [label for pattern, label in _TEXT_ISSUE_PATTERNS if pattern.search(text)]
+        return [label for i, (_, label) in enumerate(_TEXT_ISSUE_PATTERNS) if i in matched]
+
     def _build_ocr_cleanup_patterns(self) -> List[Tuple[str, str]]:
         """Build patterns for cleaning OCR artifacts"""
         return [
@@ -218,7 +308,7 @@ class TextQualityEnhancer:
         cleaned = text
 
         for pattern, replacement in self.ocr_patterns:
-            cleaned = re.sub(pattern, replacement, cleaned)
+            cleaned = pattern.sub(replacement, cleaned)
 
         return cleaned
 
@@ -227,7 +317,7 @@ class TextQualityEnhancer:
         cleaned = text
 
         for pattern, replacement in self.rpg_patterns:
-            cleaned = re.sub(pattern, replacement, cleaned)
+            cleaned = pattern.sub(replacement, cleaned)
 
         return cleaned
 
@@ -242,7 +332,7 @@ class TextQualityEnhancer:
 
         for word in words:
             # Clean word for checking (remove punctuation)
-            clean_word = re.sub(r'[^\w]', '', word.lower())
+            clean_word = _RE_NON_WORD.sub('', word.lower())
 
             if clean_word and clean_word not in self.spell_checker:
                 # Get suggestions
@@ -307,8 +397,8 @@ class TextQualityEnhancer:
     def _preserve_case_punctuation(self, original: str, corrected: str) -> str:
         """Preserve original case and punctuation in corrected word"""
         # Extract punctuation
-        leading_punct = re.match(r'^[^\w]*', original).group()
-        trailing_punct = re.search(r'[^\w]*$', original).group()
+        leading_punct = _RE_LEADING_PUNCT.match(original).group()
+        trailing_punct = _RE_TRAILING_PUNCT.search(original).group()
 
         # Apply case pattern
         if original.isupper():
@@ -336,12 +426,12 @@ class TextQualityEnhancer:
         text = self._smart_newline_cleanup(text)
 
         # Stage 2: Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+        text = _RE_WHITESPACE.sub(' ', text)
+        text = _RE_EXCESS_NEWLINES.sub('\n\n', text)
 
         # Stage 3: Clean up punctuation
-        text = re.sub(r'\s+([,.!?;:])', r'\1', text)
-        text = re.sub(r'([.!?])\s*([A-Z])', r'\1 \2', text)
+        text = _RE_SPACE_BEFORE_PUNCT.sub(r'\1', text)
+        text = _RE_SENTENCE_SPACING.sub(r'\1 \2', text)
 
         return text.strip()
 
@@ -426,6 +516,11 @@ class TextQualityEnhancer:
 
         return '\n'.join(final_text)
 
+    def _normalized_words(self, text: str) -> List[str]:
+        """Lowercased words with punctuation stripped, as used for spell checking"""
+        words = [_RE_NON_WORD.sub('', word.lower()) for word in text.split()]
+        return [w for w in words if w]
+
     def _assess_text_quality(self, text: str) -> QualityMetrics:
         """Assess overall text quality and provide metrics"""
         if not text.strip():
@@ -441,8 +536,12 @@ class TextQualityEnhancer:
                 grade="F"
             )
 
+        # Tokenize and look up unknown words once for both spelling checks
+        words = self._normalized_words(text)
+        unknown_words = self.spell_checker.unknown(set(words)) if self.spell_checker else None
+
         # Calculate individual scores
-        spelling_score = self._calculate_spelling_score(text)
+        spelling_score = self._calculate_spelling_score(text, words, unknown_words)
         character_score = self._calculate_character_score(text)
         readability_score = self._calculate_readability_score(text)
 
@@ -454,7 +553,7 @@ class TextQualityEnhancer:
         )
 
         # Identify issues
-        issues = self._identify_text_issues(text)
+        issues = self._identify_text_issues(text, words, unknown_words)
 
         # Calculate grade
         grade = self._score_to_grade(overall_score)
@@ -471,18 +570,20 @@ class TextQualityEnhancer:
             grade=grade
         )
 
-    def _calculate_spelling_score(self, text: str) -> float:
+    def _calculate_spelling_score(self, text: str, words: Optional[List[str]] = None,
+                                  unknown_words: Optional[set] = None) -> float:
         """Calculate spelling accuracy score"""
         if not self.spell_checker:
             return 85.0  # Default score when spell checker unavailable
 
-        words = [re.sub(r'[^\w]', '', word.lower()) for word in text.split()]
-        words = [w for w in words if w and len(w) > 1]
+        if words is None:
+            words = self._normalized_words(text)
+        words = [w for w in words if len(w) > 1]
 
         if not words:
             return 100.0
 
-        misspelled = self.spell_checker.unknown(words)
+        misspelled = self._misspelled(words, unknown_words)
         correct_words = len(words) - len(misspelled)
 
         return (correct_words / len(words)) * 100
@@ -496,18 +597,8 @@ class TextQualityEnhancer:
             return 100.0
 
         # Check for common OCR artifacts
-        ocr_artifacts = [
-            r'\b0\b(?![0-9])',  # Standalone zeros (likely O)
-            r'\bl\b(?![a-z])',  # Standalone l (likely I)
-            r'rn(?=[a-z])',     # rn that should be m
-            r'[\u201c\u201d\u201e]',  # Smart quotes
-            r'[\u2018\u2019\u201a]',  # Smart apostrophes
-            r'\s{2,}',          # Multiple spaces
-            r'([a-z])\s+([a-z])',  # Spaced letters within words
-        ]
-
-        for pattern in ocr_artifacts:
-            matches = re.findall(pattern, text)
+        for pattern in _OCR_ARTIFACT_PATTERNS:
+            matches = pattern.findall(text)
             issues += len(matches)
 
         # Calculate score
@@ -519,7 +610,7 @@ class TextQualityEnhancer:
         if not text.strip():
             return 0.0
 
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _RE_SENTENCE_SPLIT.split(text)
         sentences = [s.strip() for s in sentences if s.strip()]
 
         if not sentences:
@@ -547,30 +638,29 @@ class TextQualityEnhancer:
 
         return (length_score + capitalization_score + punctuation_score) / 3
 
-    def _identify_text_issues(self, text: str) -> List[str]:
-        """Identify specific issues in the text"""
-        issues = []
-
-        # Check for common problems
-        if re.search(r'\s{3,}', text):
-            issues.append("Excessive whitespace detected")
+    def _misspelled(self, words: List[str], unknown_words: Optional[set]) -> set:
+        """Unique misspelled words, from a pre-computed unknown set when given"""
+        if unknown_words is None:
+            return self.spell_checker.unknown(words)
+        return {w for w in words if w in unknown_words}
 
-        if re.search(r'([a-z])\s+([a-z])', text):
-            issues.append("Spaced letters within words (OCR artifact)")
-
-        if re.search(r'[\u201c\u201d\u201e]', text) or re.search(r'[\u2018\u2019\u201a]', text):
-            issues.append("Smart quotes/apostrophes detected")
+    def _identify_text_issues(self, text: str, words: Optional[List[str]] = None,
+                              unknown_words: Optional[set] = None) -> List[str]:
+        """Identify specific issues in the text"""
+        # Check for common problems in a single scan
+        issues = self._scan_text_issues(text)
 
         if self.spell_checker:
-            words = [re.sub(r'[^\w]', '', word.lower()) for word in text.split()]
-            words = [w for w in words if w and len(w) > 2]
-            misspelled = self.spell_checker.unknown(words)
+            if words is None:
+                words = self._normalized_words(text)
+            words = [w for w in words if len(w) > 2]
+            misspelled = self._misspelled(words, unknown_words)
 
             if len(misspelled) > len(words) * 0.1:  # More than 10% misspelled
                 issues.append(f"High spelling error rate: {len(misspelled)} misspelled words")
 
         # Check for very short or very long sentences
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _RE_SENTENCE_SPLIT.split(text)
         sentences = [s.strip() for s in sentences if s.strip()]
 
         for sentence in sentences:
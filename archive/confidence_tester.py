@@ -6,16 +6,70 @@ Tests extraction quality and provides confidence metrics before full processing
 
 import json
 import logging
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 import fitz  # PyMuPDF
 import numpy as np
 from dataclasses import dataclass
 import re
 from datetime import datetime
 
-@dataclass
+# Prefer an in-process Tesseract API over pytesseract's per-call subprocess
+try:
+    import tesserocr
+    from PIL import Image
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+# Otherwise OCR through pytesseract, on pages decoded with OpenCV
+try:
+    import pytesseract
+    import cv2
+    PYTESSERACT_AVAILABLE = True
+except ImportError:
+    PYTESSERACT_AVAILABLE = False
+
+# orjson encodes reports in C; fall back to the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional progress bar for batch runs
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+
+# Structure detection patterns, compiled once and matched per line
+_HEADING_NUM = re.compile(r'^\d+\.\s+[A-Z]')
+_LIST_BULLET = re.compile(r'^\s*[-*•]\s+')
+_LIST_NUM = re.compile(r'^\s*\d+\)\s+')
+_LIST_ALPHA = re.compile(r'^\s*[a-z]\)\s+')
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize obj to indented UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+@dataclass(frozen=True)
 class ConfidenceMetrics:
+    # Explicit slots (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = (
+        'overall_confidence', 'text_extraction_confidence', 'ocr_confidence',
+        'layout_detection_confidence', 'table_detection_confidence',
+        'content_structure_confidence', 'recommended_method', 'issues_found',
+        'sample_extractions'
+    )
+    
     overall_confidence: float
     text_extraction_confidence: float
     ocr_confidence: float
@@ -29,21 +83,91 @@ class ConfidenceMetrics:
 class PDFConfidenceTester:
     def __init__(self, pdf_path: str):
         self.pdf_path = Path(pdf_path)
-        self.doc = fitz.open(pdf_path)
         self.logger = logging.getLogger(__name__)
         
+        self._tess_api = None  # Created on first OCR page, reused after
+        
+        # Per-page caches shared by the text, table and structure tests
+        self._text_cache: Dict[int, str] = {}
+        self._lines_cache: Dict[int, List[str]] = {}
+        
+        # Only keep the page count; each sub-test opens its own handle
+        with self._doc() as doc:
+            self.page_count = len(doc)
+        
         # Test configuration
-        self.test_pages = min(5, len(self.doc))  # Test first 5 pages or all if fewer
+        self.test_pages = min(5, self.page_count)  # Sample 5 pages across the document, or all if fewer
         self.sample_size = 3  # Number of sample extractions to show
+    
+    @property
+    def test_pages(self) -> int:
+        return len(self._page_indices)
+    
+    @test_pages.setter
+    def test_pages(self, count: int):
+        self._page_indices = self._stratified_sample(self.page_count, min(count, self.page_count))
+    
+    @staticmethod
+    def _stratified_sample(page_count: int, k: int) -> List[int]:
+        """Pick k page indices: one from the first 10%, the rest spread over the body, one from the last 10%"""
+        if k >= page_count:
+            return list(range(page_count))
+        if k <= 0:
+            return []
+        if k == 1:
+            return [page_count // 2]
+        
+        edge = max(1, page_count // 10)
+        head, tail = edge // 2, page_count - 1 - edge // 2
+        body_start, body_end = edge, page_count - edge
+        middle = k - 2
+        body = [body_start + int((i + 0.5) * (body_end - body_start) / middle) for i in range(middle)]
+        return sorted({head, *body, tail})
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+    
+    def close(self):
+        """Release the Tesseract API and cached MuPDF resources"""
+        if self._tess_api is not None:
+            self._tess_api.End()
+            self._tess_api = None
+        fitz.TOOLS.store_shrink(100)
+    
+    @contextmanager
+    def _doc(self):
+        """Open the PDF for the duration of a single sub-test"""
+        doc = fitz.open(self.pdf_path)
+        try:
+            yield doc
+        finally:
+            doc.close()
         
     def run_comprehensive_test(self) -> ConfidenceMetrics:
         """Run all confidence tests and return comprehensive metrics"""
         self.logger.info(f"Running confidence tests on {self.pdf_path.name}")
-        self.logger.info(f"Testing {self.test_pages} pages out of {len(self.doc)} total")
+        self.logger.info(f"Testing {self.test_pages} pages out of {self.page_count} total "
+                         f"(pages {', '.join(str(n + 1) for n in self._page_indices)})")
         
         # Run individual tests
         text_conf = self._test_text_extraction()
-        ocr_conf = self._test_ocr_extraction()
+        
+        # OCR is by far the slowest test; skip it when text extraction is clearly good
+        ocr_skipped = text_conf['confidence'] >= 90 and text_conf['avg_chars_per_page'] > 800
+        if ocr_skipped:
+            self.logger.info("Skipping OCR test: text extraction already high-confidence")
+            ocr_conf = {
+                'confidence': 0,
+                'samples': [],
+                'issues': ['OCR skipped: text extraction already high-confidence'],
+                'page_confidences': []
+            }
+        else:
+            ocr_conf = self._test_ocr_extraction()
         layout_conf = self._test_layout_detection()
         table_conf = self._test_table_detection()
         structure_conf = self._test_content_structure()
@@ -65,6 +189,12 @@ class PDFConfidenceTester:
             'structure': 0.15
         }
         
+        # Re-normalize over the tests that actually ran
+        if ocr_skipped:
+            remaining = 1 - weights['ocr']
+            weights = {name: (0 if name == 'ocr' else weight / remaining)
+                       for name, weight in weights.items()}
+        
         overall = (
             text_conf['confidence'] * weights['text'] +
             ocr_conf['confidence'] * weights['ocr'] +
@@ -102,10 +232,7 @@ class PDFConfidenceTester:
         text_samples = []
         issues = []
         
-        for page_num in range(self.test_pages):
-            page = self.doc[page_num]
-            text = page.get_text()
-            
+        for page_num, text in self._iter_page_texts():
             total_chars += len(text)
             
             if len(text.strip()) > 50:  # Meaningful text threshold
@@ -158,66 +285,64 @@ class PDFConfidenceTester:
         """Test OCR-based extraction confidence"""
         self.logger.info("Testing OCR extraction...")
         
-        try:
-            import pytesseract
-            import cv2
-            import numpy as np
-        except ImportError:
+        if not TESSEROCR_AVAILABLE and not PYTESSERACT_AVAILABLE:
             return {
                 'confidence': 0,
                 'samples': [],
-                'issues': ['OCR dependencies not installed (pytesseract, opencv-python)']
+                'issues': ['OCR dependencies not installed (tesserocr or pytesseract, opencv-python)']
             }
         
         ocr_samples = []
         confidence_scores = []
         issues = []
         
-        for page_num in range(min(3, self.test_pages)):  # Test fewer pages for OCR (slower)
-            try:
-                page = self.doc[page_num]
-                pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x scale
-                img_data = pix.tobytes("png")
-                
-                # Convert to OpenCV format
-                nparr = np.frombuffer(img_data, np.uint8)
-                img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-                
-                # Test OCR on full page
-                ocr_data = pytesseract.image_to_data(
-                    img, 
-                    config=r'--oem 3 --psm 6',
-                    output_type=pytesseract.Output.DICT
-                )
-                
-                # Calculate confidence
-                confidences = [c for c in ocr_data['conf'] if c > 0]
-                page_confidence = sum(confidences) / len(confidences) if confidences else 0
-                confidence_scores.append(page_confidence)
-                
-                # Extract text
-                words = []
-                for i, (text, conf) in enumerate(zip(ocr_data['text'], ocr_data['conf'])):
-                    if conf > 30 and text.strip():
-                        words.append(text)
-                
-                ocr_text = ' '.join(words)
-                
-                if len(ocr_samples) < self.sample_size:
-                    ocr_samples.append({
-                        'page': page_num + 1,
-                        'method': 'ocr_extraction',
-                        'content': ocr_text[:300] + "..." if len(ocr_text) > 300 else ocr_text,
-                        'confidence': page_confidence,
-                        'word_count': len(words)
-                    })
-                
-                if page_confidence < 50:
-                    issues.append(f"Page {page_num + 1}: Low OCR confidence ({page_confidence:.1f}%)")
+        with self._doc() as doc:
+            for page_num in self._page_indices[:3]:  # Test fewer pages for OCR (slower)
+                try:
+                    pix = doc[page_num].get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x scale
                     
-            except Exception as e:
-                issues.append(f"Page {page_num + 1}: OCR failed - {str(e)}")
-                confidence_scores.append(0)
+                    if TESSEROCR_AVAILABLE:
+                        img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+                    else:
+                        # Convert to OpenCV format
+                        nparr = np.frombuffer(pix.tobytes("png"), np.uint8)
+                        img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+                    
+                    # Free the pixmap now rather than when a larger one evicts it
+                    pix = None
+                    fitz.TOOLS.store_shrink(100)
+                    
+                    # Test OCR on full page
+                    ocr_words = self._ocr_words(img)
+                    
+                    # Calculate confidence
+                    confidences = [c for _, c in ocr_words if c > 0]
+                    page_confidence = sum(confidences) / len(confidences) if confidences else 0
+                    confidence_scores.append(page_confidence)
+                    
+                    # Extract text
+                    words = []
+                    for text, conf in ocr_words:
+                        if conf > 30 and text.strip():
+                            words.append(text)
+                    
+                    ocr_text = ' '.join(words)
+                    
+                    if len(ocr_samples) < self.sample_size:
+                        ocr_samples.append({
+                            'page': page_num + 1,
+                            'method': 'ocr_extraction',
+                            'content': ocr_text[:300] + "..." if len(ocr_text) > 300 else ocr_text,
+                            'confidence': page_confidence,
+                            'word_count': len(words)
+                        })
+                    
+                    if page_confidence < 50:
+                        issues.append(f"Page {page_num + 1}: Low OCR confidence ({page_confidence:.1f}%)")
+                        
+                except Exception as e:
+                    issues.append(f"Page {page_num + 1}: OCR failed - {str(e)}")
+                    confidence_scores.append(0)
         
         avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0
         
@@ -228,6 +353,36 @@ class PDFConfidenceTester:
             'issues': issues
         }
     
+    def _get_tess_api(self):
+        """Lazily create the Tesseract API so the model loads once per tester"""
+        if self._tess_api is None:
+            self._tess_api = tesserocr.PyTessBaseAPI(
+                psm=tesserocr.PSM.SINGLE_BLOCK,
+                oem=tesserocr.OEM.LSTM_ONLY
+            )
+        return self._tess_api
+    
+    def _ocr_words(self, img) -> List[Tuple[str, float]]:
+        """Run OCR on a page image and return (word, confidence) pairs"""
+        if TESSEROCR_AVAILABLE:
+            api = self._get_tess_api()
+            api.SetImage(img)
+            api.Recognize()
+            iterator = api.GetIterator()
+            if iterator is None:
+                return []
+            
+            level = tesserocr.RIL.WORD
+            return [(word.GetUTF8Text(level) or '', word.Confidence(level))
+                    for word in tesserocr.iterate_level(iterator, level)]
+        
+        ocr_data = pytesseract.image_to_data(
+            img, 
+            config=r'--oem 3 --psm 6',
+            output_type=pytesseract.Output.DICT
+        )
+        return list(zip(ocr_data['text'], ocr_data['conf']))
+    
     def _test_layout_detection(self) -> Dict:
         """Test layout detection (single vs multi-column)"""
         self.logger.info("Testing layout detection...")
@@ -235,11 +390,8 @@ class PDFConfidenceTester:
         layout_results = []
         issues = []
         
-        for page_num in range(self.test_pages):
-            page = self.doc[page_num]
-            
+        for page_num, blocks in self._iter_page_dicts():
             # Get text blocks with positions
-            blocks = page.get_text("dict")
             text_blocks = []
             page_width = 0
             
@@ -273,8 +425,11 @@ class PDFConfidenceTester:
         
         # Check consistency
         layout_types = [r['layout_type'] for r in layout_results]
-        most_common = max(set(layout_types), key=layout_types.count) if layout_types else 'unknown'
-        consistency = layout_types.count(most_common) / len(layout_types) if layout_types else 0
+        if layout_types:
+            most_common, most_common_count = Counter(layout_types).most_common(1)[0]
+            consistency = most_common_count / len(layout_types)
+        else:
+            most_common, consistency = 'unknown', 0
         
         if consistency < 0.8:
             issues.append(f"Inconsistent layout detection across pages (consistency: {consistency:.1%})")
@@ -287,6 +442,12 @@ class PDFConfidenceTester:
             'issues': issues
         }
     
+    def _iter_page_dicts(self):
+        """Yield (page_num, text dict) for each tested page"""
+        with self._doc() as doc:
+            for page_num in self._page_indices:
+                yield page_num, doc[page_num].get_text("dict")
+    
     def _analyze_page_layout(self, text_blocks: List[Dict], page_width: float) -> Dict:
         """Analyze layout of a single page"""
         if not text_blocks or page_width == 0:
@@ -341,7 +502,7 @@ class PDFConfidenceTester:
             import pdfplumber
             
             with pdfplumber.open(self.pdf_path) as pdf:
-                for page_num in range(self.test_pages):
+                for page_num in self._page_indices:
                     if page_num < len(pdf.pages):
                         page = pdf.pages[page_num]
                         tables = page.extract_tables()
@@ -362,15 +523,14 @@ class PDFConfidenceTester:
             issues.append(f"Table extraction failed: {str(e)}")
         
         # Test text-based table detection
-        for page_num in range(self.test_pages):
-            page = self.doc[page_num]
-            text = page.get_text()
+        for page_num, text in self._iter_page_texts():
+            text_lower = text.lower()
             
             # Look for table indicators
             for indicator in table_indicators:
-                if indicator.lower() in text.lower():
+                if indicator.lower() in text_lower:
                     # Try to find structured data nearby
-                    lines = text.split('\n')
+                    lines = self._lines(page_num)
                     for i, line in enumerate(lines):
                         if indicator.lower() in line.lower():
                             # Check next few lines for table-like structure
@@ -409,6 +569,31 @@ class PDFConfidenceTester:
             'issues': issues
         }
     
+    def _page_text(self, page_num: int) -> str:
+        """Plain text of a page, extracted once and cached"""
+        if page_num not in self._text_cache:
+            with self._doc() as doc:
+                self._text_cache[page_num] = doc[page_num].get_text()
+        return self._text_cache[page_num]
+    
+    def _lines(self, page_num: int) -> List[str]:
+        """Lines of a page, split once and cached"""
+        lines = self._lines_cache.get(page_num)
+        if lines is None:
+            lines = self._lines_cache[page_num] = self._page_text(page_num).splitlines()
+        return lines
+    
+    def _iter_page_texts(self):
+        """Yield (page_num, plain text) for each tested page"""
+        missing = [n for n in self._page_indices if n not in self._text_cache]
+        if missing:
+            with self._doc() as doc:
+                for page_num in missing:
+                    self._text_cache[page_num] = doc[page_num].get_text()
+        
+        for page_num in self._page_indices:
+            yield page_num, self._text_cache[page_num]
+    
     def _looks_like_table(self, lines: List[str]) -> bool:
         """Check if lines look like they contain tabular data"""
         tabular_lines = 0
@@ -441,28 +626,24 @@ class PDFConfidenceTester:
         issues = []
         total_text_length = 0
         
-        for page_num in range(self.test_pages):
-            page = self.doc[page_num]
-            text = page.get_text()
+        for page_num, text in self._iter_page_texts():
             total_text_length += len(text)
             
-            lines = text.split('\n')
-            
-            for line in lines:
+            for line in self._lines(page_num):
                 line = line.strip()
                 if not line:
                     continue
                 
                 # Detect headings (ALL CAPS, numbered, etc.)
                 if (line.isupper() and len(line) > 5 and len(line) < 80) or \
-                   re.match(r'^\d+\.\s+[A-Z]', line) or \
+                   _HEADING_NUM.match(line) or \
                    (line.endswith(':') and len(line.split()) <= 6):
                     structure_elements['headings'] += 1
                 
                 # Detect lists
-                elif re.match(r'^\s*[-*•]\s+', line) or \
-                     re.match(r'^\s*\d+\)\s+', line) or \
-                     re.match(r'^\s*[a-z]\)\s+', line):
+                elif _LIST_BULLET.match(line) or \
+                     _LIST_NUM.match(line) or \
+                     _LIST_ALPHA.match(line):
                     structure_elements['lists'] += 1
                 
                 # Regular paragraphs
@@ -525,12 +706,12 @@ class PDFConfidenceTester:
 
 def run_quick_test(pdf_path: str, pages_to_test: int = 3) -> Dict:
     """Run a quick confidence test on just a few pages"""
-    tester = PDFConfidenceTester(pdf_path)
-    tester.test_pages = min(pages_to_test, len(tester.doc))
-    
-    # Run basic tests only
-    text_conf = tester._test_text_extraction()
-    layout_conf = tester._test_layout_detection()
+    with PDFConfidenceTester(pdf_path) as tester:
+        tester.test_pages = min(pages_to_test, tester.page_count)
+        
+        # Run basic tests only
+        text_conf = tester._test_text_extraction()
+        layout_conf = tester._test_layout_detection()
     
     return {
         'quick_confidence': (text_conf['confidence'] + layout_conf['confidence']) / 2,
@@ -540,6 +721,30 @@ def run_quick_test(pdf_path: str, pages_to_test: int = 3) -> Dict:
         'issues': text_conf.get('issues', []) + layout_conf.get('issues', [])
     }
 
+def run_batch_quick_test(pdf_paths: List[str], pages_to_test: int = 3,
+                         workers: Optional[int] = None) -> Dict[str, Dict]:
+    """Run quick confidence tests on many PDFs using a shared process pool"""
+    results = {}
+    
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = {
+            executor.submit(run_quick_test, pdf_path, pages_to_test): pdf_path
+            for pdf_path in pdf_paths
+        }
+        
+        completed = as_completed(futures)
+        if TQDM_AVAILABLE:
+            completed = tqdm(completed, total=len(futures), desc="Confidence tests")
+        
+        for future in completed:
+            pdf_path = futures[future]
+            try:
+                results[pdf_path] = future.result()
+            except Exception as e:
+                results[pdf_path] = {'error': str(e)}
+    
+    return results
+
 def generate_confidence_report(metrics: ConfidenceMetrics, output_path: str = None):
     """Generate a detailed confidence report"""
     report = {
@@ -562,8 +767,8 @@ def generate_confidence_report(metrics: ConfidenceMetrics, output_path: str = No
     }
     
     if output_path:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(_json_dumps(report))
     
     return report
 
@@ -612,10 +817,11 @@ if __name__ == "__main__":
     import argparse
     
     parser = argparse.ArgumentParser(description="Test PDF extraction confidence")
-    parser.add_argument("pdf_path", help="Path to PDF file")
+    parser.add_argument("pdf_path", nargs='+', help="Path to PDF file(s); several paths run a batch quick test")
     parser.add_argument("-p", "--pages", type=int, default=5, help="Number of pages to test")
     parser.add_argument("-q", "--quick", action="store_true", help="Run quick test only")
     parser.add_argument("-o", "--output", help="Output report file")
+    parser.add_argument("-w", "--workers", type=int, help="Worker processes for batch runs (default: CPU count)")
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
     
     args = parser.parse_args()
@@ -625,8 +831,25 @@ if __name__ == "__main__":
     logging.basicConfig(level=level, format='%(levelname)s: %(message)s')
     
     try:
-        if args.quick:
-            results = run_quick_test(args.pdf_path, args.pages)
+        if len(args.pdf_path) > 1:
+            batch_results = run_batch_quick_test(args.pdf_path, args.pages, args.workers)
+            print(f"\n=== BATCH QUICK CONFIDENCE TEST ({len(batch_results)} files) ===")
+            
+            for pdf_path in args.pdf_path:
+                results = batch_results[pdf_path]
+                if 'error' in results:
+                    print(f"  ❌ {pdf_path}: {results['error']}")
+                else:
+                    print(f"  {pdf_path}: {results['quick_confidence']:.1f}% "
+                          f"(recommended: {results['recommended_method']})")
+            
+            if args.output:
+                with open(args.output, 'wb') as f:
+                    f.write(_json_dumps(batch_results))
+                print(f"\nBatch results saved to: {args.output}")
+        
+        elif args.quick:
+            results = run_quick_test(args.pdf_path[0], args.pages)
             print(f"\n=== QUICK CONFIDENCE TEST ===")
             print(f"Overall Confidence: {results['quick_confidence']:.1f}%")
             print(f"Recommended Method: {results['recommended_method']}")
@@ -638,9 +861,9 @@ if __name__ == "__main__":
                 for issue in results['issues']:
                     print(f"  - {issue}")
         else:
-            tester = PDFConfidenceTester(args.pdf_path)
-            tester.test_pages = args.pages
-            metrics = tester.run_comprehensive_test()
+            with PDFConfidenceTester(args.pdf_path[0]) as tester:
+                tester.test_pages = min(args.pages, tester.page_count)
+                metrics = tester.run_comprehensive_test()
             
             # Generate report
             report = generate_confidence_report(metrics, args.output)
@@ -5,18 +5,32 @@ Retroactively enhance existing database content with text quality improvements
 """
 
 import argparse
+import bisect
+import hashlib
+import heapq
 import json
+import math
 import os
+import queue
+import random
 import re
 import sys
+import threading
 import time
-from datetime import datetime
+from collections import Counter
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any
+
+import numpy as np
 
 # Import MongoDB manager
 try:
     sys.path.append(str(Path(__file__).resolve().parent.parent))
+    from pymongo import UpdateOne
     from Modules.mongodb_manager import MongoDBManager
     from Modules.multi_collection_manager import MultiGameCollectionManager
     MONGODB_AVAILABLE = True
@@ -36,12 +50,119 @@ except ImportError:
     print("⚠️ NLTK not available. Install with: pip install nltk")
     NLTK_AVAILABLE = False
 
+# orjson encodes backups and reports in C; fall back to the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# hyperscan checks all RPG terms in one SIMD pass; fall back to substring checks
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# marisa-trie holds the dictionary in a few MB with native prefix queries;
+# fall back to a set plus a sorted index
+try:
+    import marisa_trie
+    MARISA_AVAILABLE = True
+except ImportError:
+    MARISA_AVAILABLE = False
+
+# Write buffer for report files, so streamed documents are flushed in large chunks
+REPORT_BUFFER_SIZE = 1 << 20
+
+# Number of biggest quality improvements listed in the report summary
+TOP_IMPROVEMENTS = 5
+
+# Scores kept for report percentiles (exact up to this many documents, sampled beyond)
+SCORE_SAMPLE_SIZE = 10000
+
+# Documents fetched per round trip while scanning (only projected fields travel)
+SCAN_BATCH_SIZE = 500
+
+# Full documents fetched per round trip while streaming a backup to disk
+BACKUP_BATCH_SIZE = 500
+
+# Index backing the server-side "already enhanced" filter used with --trust-index
+ENHANCED_QUALITY_INDEX = [("metadata.enhanced", 1), ("metadata.quality_score", 1)]
+
+# Texts whose analysis/enhancement results are kept per enhancer (bounds the memory
+# the caches hold, since they keep each cached text alive)
+ANALYSIS_CACHE_SIZE = 1024
+
+# Text enhancement patterns, compiled once at import
+_RE_SPACE_RUN = re.compile(r' *\n *| {2,}')  # Spaces around a newline, or repeated spaces
+_RE_CAMEL_CASE = re.compile(r'([a-z])([A-Z])')
+_RE_CAMEL_WORD = re.compile(r'([a-z]+)([A-Z][a-z]+)')
+_RE_PUNCTUATION_SPACING = re.compile(r'(\w[.,;:])(?=\w)')  # "word.Another" -> "word. Another"
+
+# Whole-word OCR misreads; none of these is a real word, so they are always fixed
+_OCR_WORD_FIXES = {
+    "rn": "m",
+    "cornbat": "combat",
+    "tirne": "time",
+    "sarne": "same",
+    "frorn": "from",
+}
+
+# Single-character OCR misreads; these are real characters too, so each is only
+# fixed in text where the correct character never appears (a systematic misread)
+_OCR_CHAR_FIXES = {
+    "0": "o",  # Zero vs o
+    "l": "i",  # lowercase L vs i
+}
+
+# Common word run-ons in RPG texts
+_COMMON_SPLITS = {
+    "isused": "is used",
+    "isthe": "is the",
+    "tothe": "to the",
+    "andthe": "and the",
+    "forthe": "for the",
+    "ofthe": "of the",
+    "inthe": "in the",
+    "trackof": "track of",
+    "Malevolentand": "Malevolent and",
+    "Benignisthe": "Benign is the",
+}
+
+
+def _alternation(words: Iterable[str]) -> str:
+    """Regex alternation over literal words, longest first so longer keys win"""
+    return "|".join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+
+
+def _count_char_differences(original: str, enhanced: str) -> int:
+    """
+    Characters differing position by position, plus the length difference
+    (compared as UTF-32 code points so numpy does the per-character loop)
+    """
+    a = np.frombuffer(original.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    b = np.frombuffer(enhanced.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    shared = min(a.size, b.size)
+    return int(np.count_nonzero(a[:shared] != b[:shared])) + abs(a.size - b.size)
+
+
+_RE_OCR_WORD = re.compile(rf"\b(?:{_alternation(_OCR_WORD_FIXES)})\b")
+_RE_COMMON_SPLIT = re.compile(_alternation(_COMMON_SPLITS))
+
 
 class TextQualityEnhancer:
     """Text quality analysis and enhancement tool"""
     
     def __init__(self, debug: bool = False):
         self.debug = debug
+        
+        # Results depend only on the text, so identical texts (a scanned document
+        # re-analyzed in its before/after comparison, repeated boilerplate pages)
+        # are processed once
+        self._analyze_cached = lru_cache(maxsize=ANALYSIS_CACHE_SIZE)(self._analyze_text)
+        self._enhance_cached = lru_cache(maxsize=ANALYSIS_CACHE_SIZE)(self._enhance_text)
+        
         # Common words in RPG content to help identify missing spaces
         self.common_rpg_terms = [
             "FIEND", "FOLIO", "TOME", "DUNGEON", "MASTER", "DRAGON", 
@@ -52,17 +173,99 @@ class TextQualityEnhancer:
             "BARBARIAN", "MONK"
         ]
         
+        # Missing-space patterns over all terms at once: letter+TERM and TERM+letter
+        terms = "|".join(re.escape(term) for term in self.common_rpg_terms)
+        self.term_before = re.compile(f"([a-z])({terms})", re.IGNORECASE)
+        self.term_after = re.compile(f"({terms})([a-z])", re.IGNORECASE)
+        self.rpg_terms_upper = frozenset(term.upper() for term in self.common_rpg_terms)
+        self.rpg_terms_lower = tuple(term.lower() for term in self.common_rpg_terms)
+        self.term_scanner = self._build_term_scanner()
+        
         # Load dictionary if NLTK available
-        self.dictionary = set()
+        self.set_dictionary([])
         if NLTK_AVAILABLE:
             try:
                 from nltk.corpus import words
                 nltk.download('words', quiet=True)
-                self.dictionary = set(w.lower() for w in words.words())
+                self.set_dictionary(words.words())
                 print(f"📚 Loaded {len(self.dictionary)} dictionary words")
             except Exception as e:
                 print(f"⚠️ Could not load dictionary words: {e}")
     
+    def set_dictionary(self, words: Iterable[str]):
+        """
+        Use the given words for run-on word splitting
+        """
+        dictionary = set(w.lower() for w in words)
+        
+        # Index of every word a split may produce, for prefix lookups
+        split_words = dictionary.union(t.lower() for t in self.common_rpg_terms)
+        if MARISA_AVAILABLE:
+            self.dictionary = marisa_trie.Trie(dictionary)
+            self._word_index = marisa_trie.Trie(split_words)
+        else:
+            self.dictionary = dictionary
+            self._word_index = sorted(split_words)
+        
+        # Enhancement depends on the dictionary
+        self._enhance_cached.cache_clear()
+    
+    def _is_word_prefix(self, prefix: str) -> bool:
+        """
+        Whether any dictionary word or RPG term starts with prefix
+        """
+        if MARISA_AVAILABLE:
+            return next(self._word_index.iterkeys(prefix), None) is not None
+        
+        i = bisect.bisect_left(self._word_index, prefix)
+        return i < len(self._word_index) and self._word_index[i].startswith(prefix)
+    
+    def _build_term_scanner(self):
+        """
+        Compile the RPG terms into one caseless hyperscan database, if available
+        """
+        if not HYPERSCAN_AVAILABLE:
+            return None
+        
+        try:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[re.escape(term).encode('ascii') for term in self.common_rpg_terms],
+                ids=list(range(len(self.common_rpg_terms))),
+                elements=len(self.common_rpg_terms),
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH]
+                * len(self.common_rpg_terms),
+            )
+            return database
+        except Exception as e:
+            print(f"⚠️ hyperscan compile failed, using substring checks for terms: {e}")
+            return None
+    
+    def _may_contain_term(self, text: str) -> bool:
+        """
+        Cheap pre-check for the case-insensitive term patterns (exact for
+        ASCII; other text may case-fold onto a term, so it is always treated
+        as a possible match)
+        """
+        if not text.isascii():
+            return True
+        
+        if self.term_scanner is not None:
+            found = []
+            
+            def on_match(pattern_id, start, end, flags, context):
+                found.append(pattern_id)
+                return True  # Stop at the first term
+            
+            try:
+                self.term_scanner.scan(text.encode('ascii'), match_event_handler=on_match)
+            except hyperscan.ScanTerminated:
+                pass
+            return bool(found)
+        
+        lowered = text.lower()
+        return any(term in lowered for term in self.rpg_terms_lower)
+    
     def analyze_quality(self, text: str) -> Dict[str, Any]:
         """
         Analyze text quality and return metrics
@@ -70,6 +273,40 @@ class TextQualityEnhancer:
         if not text:
             return {"quality_score": 0, "issues": ["empty_text"], "issue_count": 1}
         
+        quality_score, issues, issue_count = self._analyze_cached(text)
+        return {
+            "quality_score": quality_score,
+            "issues": list(issues),
+            "issue_count": issue_count,
+            "analyzed_at": datetime.now().isoformat()
+        }
+    
+    def candidate_filter(self, threshold: int, field: str = "content") -> Optional[Dict[str, Any]]:
+        """
+        MongoDB filter matching every document that could score below threshold
+        
+        Text without run-on words, missing spaces or inconsistent spacing can
+        only be flagged for OCR artifacts (at most 3 issues), so it scores at
+        least 85; for thresholds up to that, such documents need not be fetched.
+        Returns None when no document can be ruled out server-side.
+        """
+        if threshold > 100 - 3 * 5:
+            return None
+        
+        terms = "|".join(re.escape(term) for term in self.common_rpg_terms)
+        return {"$or": [
+            # Empty or missing content scores 0
+            {field: {"$not": {"$type": "string"}}},
+            {field: ""},
+            {field: {"$regex": r"\S{16}"}},
+            {field: {"$regex": f"[a-z]({terms})", "$options": "i"}},
+            {field: {"$regex": "  | \n|\n "}}
+        ]}
+    
+    def _analyze_text(self, text: str) -> Tuple[int, Tuple[str, ...], int]:
+        """
+        Score non-empty text, returning (quality_score, issues, issue_count)
+        """
         issues = []
         issue_count = 0
         
@@ -79,19 +316,19 @@ class TextQualityEnhancer:
             issues.append("run_on_words")
             issue_count += len(long_words)
         
-        # Check for missing spaces between common terms
-        for term in self.common_rpg_terms:
-            pattern = f"([a-z]){term}"
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        # Check for missing spaces between common terms (skipped when the text
+        # contains no term at all, which is the case for most clean text)
+        if self._may_contain_term(text):
+            matches = self.term_before.findall(text)
             if matches:
                 issues.append("missing_spaces")
                 issue_count += len(matches)
-                break  # Only count this issue type once
         
-        # Check for inconsistent spacing
-        if "  " in text or " \n" in text or "\n " in text:
+        # Check for inconsistent spacing (counted directly; a zero count means none found)
+        spacing_issues = text.count("  ") + text.count(" \n") + text.count("\n ")
+        if spacing_issues:
             issues.append("inconsistent_spacing")
-            issue_count += text.count("  ") + text.count(" \n") + text.count("\n ")
+            issue_count += spacing_issues
         
         # Check for OCR artifacts (common patterns)
         ocr_artifacts = ["rn" in text and "m" not in text,  # 'rn' often mistaken for 'm'
@@ -107,12 +344,7 @@ class TextQualityEnhancer:
         penalty = min(issue_count * 5, 80)  # Cap penalty at 80 points
         quality_score = max(base_score - penalty, 0)
         
-        return {
-            "quality_score": quality_score,
-            "issues": issues,
-            "issue_count": issue_count,
-            "analyzed_at": datetime.now().isoformat()
-        }
+        return quality_score, tuple(issues), issue_count
     
     def enhance_text(self, text: str) -> Tuple[str, Dict[str, Any]]:
         """
@@ -121,73 +353,53 @@ class TextQualityEnhancer:
         if not text:
             return text, {"changes": 0, "enhanced": False}
         
+        enhanced_text, metrics = self._enhance_cached(text)
+        return enhanced_text, {**metrics, "enhanced_at": datetime.now().isoformat()}
+    
+    def _enhance_text(self, text: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Enhance non-empty text, returning the improved text and its metrics
+        """
         original_text = text
         changes = 0
         
-        # Fix inconsistent spacing
-        # Replace multiple spaces with a single space
-        text = re.sub(r' {2,}', ' ', text)
-        # Fix spacing around newlines
-        text = re.sub(r' \n', '\n', text)
-        text = re.sub(r'\n ', '\n', text)
+        # Fix inconsistent spacing in one pass: drop spaces around newlines
+        # and replace multiple spaces with a single space
+        text = _RE_SPACE_RUN.sub(lambda m: m.group().strip(' ') or ' ', text)
         
         if text != original_text:
             changes += 1
         
-        # Fix common OCR artifacts
-        ocr_replacements = {
-            "rn": "m",       # common OCR misread
-            "0": "o",        # Zero vs o
-            "l": "i",        # lowercase L vs i
-            "cornbat": "combat",
-            "tirne": "time",
-            "sarne": "same",
-            "frorn": "from",
-        }
+        # Fix whole-word OCR misreads in one pass
+        text, fixed = _RE_OCR_WORD.subn(lambda m: _OCR_WORD_FIXES[m.group()], text)
+        changes += fixed
+        
+        # Fix single-character OCR artifacts in one translate pass
+        char_fixes = {ord(wrong): correct for wrong, correct in _OCR_CHAR_FIXES.items()
+                      if wrong in text and correct not in text}
+        if char_fixes:
+            text = text.translate(char_fixes)
+            changes += len(char_fixes)
         
-        for wrong, correct in ocr_replacements.items():
-            # Only replace if the wrong pattern is likely an error (heuristic check)
-            if wrong in text and correct not in text:
-                text = text.replace(wrong, correct)
-                changes += 1
-        
-        # Fix missing spaces between common terms
-        for term in self.common_rpg_terms:
-            # Look for lowercase letter followed by uppercase or uppercase term
-            pattern = f"([a-z])({term})"
-            text = re.sub(pattern, r'\1 \2', text, flags=re.IGNORECASE)
+        # Fix missing spaces between common terms (only possible if a term occurs)
+        if self._may_contain_term(text):
+            # Look for a letter followed by a term
+            text = self.term_before.sub(r'\1 \2', text)
             
-            # Look for term followed by lowercase
-            pattern = f"({term})([a-z])"
-            text = re.sub(pattern, r'\1 \2', text, flags=re.IGNORECASE)
-        
-        # Fix common word run-ons in RPG texts
-        common_splits = {
-            "isused": "is used",
-            "isthe": "is the",
-            "tothe": "to the",
-            "andthe": "and the",
-            "forthe": "for the",
-            "ofthe": "of the",
-            "inthe": "in the",
-            "trackof": "track of",
-            "Malevolentand": "Malevolent and",
-            "Benignisthe": "Benign is the"
-        }
+            # Look for a term followed by a letter
+            text = self.term_after.sub(r'\1 \2', text)
         
-        for run_on, corrected in common_splits.items():
-            if run_on in text:
-                text = text.replace(run_on, corrected)
-                changes += 1
+        # Fix common word run-ons in RPG texts in one pass
+        text, fixed = _RE_COMMON_SPLIT.subn(lambda m: _COMMON_SPLITS[m.group()], text)
+        changes += fixed
         
         # Fix run-on words with better pattern matching
         # Common RPG word transitions that shouldn't have spaces
         excluded_pairs = ['Dungeon', 'Master', 'Rule', 'Book', 'Hand', 'Book']
         
         # Look for camelCase patterns (lowercase followed by uppercase)
-        pattern = r'([a-z])([A-Z])'
-        text = re.sub(pattern, lambda m: f"{m.group(1)} {m.group(2)}" 
-                    if m.group(1) + m.group(2) not in excluded_pairs else m.group(0), text)
+        text = _RE_CAMEL_CASE.sub(lambda m: f"{m.group(1)} {m.group(2)}"
+                                  if m.group(1) + m.group(2) not in excluded_pairs else m.group(0), text)
         
         # Fix run-on words if NLTK is available
         if NLTK_AVAILABLE and self.dictionary:
@@ -209,27 +421,28 @@ class TextQualityEnhancer:
             
             text = ' '.join(enhanced_words)
         
-        # Fix spacing for common punctuation
-        text = re.sub(r'(\w)\.(\w)', r'\1. \2', text)  # Fix "word.Another" -> "word. Another"
-        text = re.sub(r'(\w),(\w)', r'\1, \2', text)   # Fix "word,another" -> "word, another"
-        text = re.sub(r'(\w);(\w)', r'\1; \2', text)   # Fix "word;another" -> "word; another"
-        text = re.sub(r'(\w):(\w)', r'\1: \2', text)   # Fix "word:another" -> "word: another"
+        # Fix spacing after common punctuation (. , ; :) between words
+        text = _RE_PUNCTUATION_SPACING.sub(r'\1 ', text)
         
         # Check if there were changes
+        word_count_before = len(original_text.split())
         if text != original_text:
             changes += 1
             
             # Normalize whitespace again as a final step
-            text = ' '.join(text.split())
+            words = text.split()
+            text = ' '.join(words)
+            word_count_after = len(words)
+        else:
+            word_count_after = word_count_before
         
         metrics = {
             "changes": changes,
             "enhanced": text != original_text,
             "char_count_before": len(original_text),
             "char_count_after": len(text),
-            "word_count_before": len(original_text.split()),
-            "word_count_after": len(text.split()),
-            "enhanced_at": datetime.now().isoformat()
+            "word_count_before": word_count_before,
+            "word_count_after": word_count_after
         }
         
         return text, metrics
@@ -241,17 +454,20 @@ class TextQualityEnhancer:
         if len(word) < 8:  # Don't process short words
             return word
             
-        # Try different split positions
+        # Try different split positions, walking the first part forward like a
+        # trie: once no word starts with it, no longer first part can match
+        # (lowercasing only preserves prefixes for ASCII, so others walk fully)
+        ascii_word = word.isascii()
         for i in range(3, len(word) - 3):
             first_part = word[:i].lower()
-            second_part = word[i:].lower()
+            if ascii_word and not self._is_word_prefix(first_part):
+                break
             
             # Check if both parts are in dictionary or common RPG terms
-            if (first_part in self.dictionary or 
-                first_part.upper() in [t.upper() for t in self.common_rpg_terms]):
+            if first_part in self.dictionary or first_part.upper() in self.rpg_terms_upper:
+                second_part = word[i:].lower()
                 
-                if (second_part in self.dictionary or 
-                    second_part.upper() in [t.upper() for t in self.common_rpg_terms]):
+                if second_part in self.dictionary or second_part.upper() in self.rpg_terms_upper:
                     
                     # Preserve original case as much as possible
                     if word[0].isupper():
@@ -263,7 +479,7 @@ class TextQualityEnhancer:
         
         # Regex-based approach for common patterns
         # Look for camelCase pattern
-        camel_match = re.search(r'([a-z]+)([A-Z][a-z]+)', word)
+        camel_match = _RE_CAMEL_WORD.search(word)
         if camel_match:
             first = camel_match.group(1)
             second = camel_match.group(2)
@@ -300,10 +516,7 @@ class TextQualityEnhancer:
         if total_chars == 0:
             diff_ratio = 0
         else:
-            # Count differing characters
-            diff_count = sum(1 for i in range(min(len(original), len(enhanced))) 
-                            if original[i] != enhanced[i])
-            diff_count += abs(len(original) - len(enhanced))
+            diff_count = _count_char_differences(original, enhanced)
             diff_ratio = (diff_count / total_chars) * 100
         
         # Get quality scores
@@ -321,14 +534,121 @@ class TextQualityEnhancer:
         }
 
 
+def _orjson_option(indent: bool) -> int:
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return option
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize obj to JSON text (ObjectIds and other unknown types as strings)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=_orjson_option(indent)).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None, default=str)
+
+
+def _json_dumpb(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, for files opened in binary mode"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=_orjson_option(indent))
+    return _json_dumps(obj, indent).encode('utf-8')
+
+
+def _content_sha1(content: str) -> str:
+    """Fingerprint content so unchanged, already-enhanced documents can be skipped"""
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+# Per-process enhancer used by pool workers
+_WORKER_ENHANCER = None
+
+
+def _get_worker_enhancer(debug: bool = False) -> TextQualityEnhancer:
+    """Return this process's enhancer, building it (and loading its dictionary) once"""
+    global _WORKER_ENHANCER
+    if _WORKER_ENHANCER is None:
+        _WORKER_ENHANCER = TextQualityEnhancer(debug=debug)
+    return _WORKER_ENHANCER
+
+
+def _init_worker(debug: bool = False):
+    """Pool initializer: warm the enhancer before the worker takes its first task"""
+    _get_worker_enhancer(debug)
+
+
+def _enhance_payload(content: str, enhancer: Optional[TextQualityEnhancer] = None
+                     ) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
+    """
+    Enhance one document's content and compare it with the original
+    (module-level so it can run in worker processes, which use their
+    per-process enhancer unless one is bound)
+    """
+    if enhancer is None:
+        enhancer = _get_worker_enhancer()
+    enhanced_content, metrics = enhancer.enhance_text(content)
+    comparison = enhancer.get_before_after_comparison(content, enhanced_content)
+    return enhanced_content, metrics, comparison
+
+
+class _ScoreAccumulator:
+    """
+    Running summary of quality scores in constant memory: exact count, mean,
+    spread and range, with percentiles taken from a fixed-size reservoir sample.
+    Scores are whole percentages (0-100), so they are kept as integers and the
+    sample is stored one byte per score.
+    """
+    
+    def __init__(self, sample_size: int = SCORE_SAMPLE_SIZE):
+        self.count = 0
+        self.total = 0
+        self.sq_total = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sample = np.empty(sample_size, dtype=np.uint8)
+        self._random = random.Random()
+    
+    def add(self, score: float):
+        score = int(round(score))
+        
+        # Reservoir sampling: every score seen so far is equally likely to be kept
+        if self.count < self.sample.size:
+            self.sample[self.count] = score
+        else:
+            slot = self._random.randrange(self.count + 1)
+            if slot < self.sample.size:
+                self.sample[slot] = score
+        
+        self.count += 1
+        self.total += score
+        self.sq_total += score * score
+        self.min = min(self.min, score)
+        self.max = max(self.max, score)
+    
+    def stats(self) -> Dict[str, Any]:
+        # Integer sums give an exact variance, free of cancellation error
+        variance = (self.sq_total * self.count - self.total * self.total) / (self.count * self.count)
+        sample = self.sample[:min(self.count, self.sample.size)]
+        percentiles = np.percentile(sample, [25, 50, 75, 95]).tolist()
+        return {
+            "average": self.total / self.count,
+            "stddev": math.sqrt(variance),
+            "min": self.min,
+            "max": self.max,
+            "percentiles": dict(zip(["p25", "p50", "p75", "p95"], percentiles))
+        }
+
+
 class DatabaseContentEnhancer:
     """Tool for enhancing content quality in databases"""
     
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False, workers: int = 1):
         self.debug = debug
+        self.workers = workers
         self.enhancer = TextQualityEnhancer(debug=debug)
         self.mongodb_manager = None
         self.chromadb_manager = None
+        self._executor = None
         
         # Initialize database connections
         if MONGODB_AVAILABLE:
@@ -345,14 +665,60 @@ class DatabaseContentEnhancer:
         except Exception as e:
             print(f"❌ ChromaDB connection failed: {e}")
     
+    def ensure_indexes(self, collections: List[str]):
+        """
+        Create the index that lets MongoDB filter out already-enhanced documents
+        """
+        if not (self.mongodb_manager and self.mongodb_manager.connected):
+            return
+        
+        for collection_name in collections:
+            result = self.mongodb_manager.create_index(collection_name, ENHANCED_QUALITY_INDEX)
+            if not result["success"]:
+                print(f"⚠️ Could not index mongodb:{collection_name}: {result['error']}")
+    
+    def apply_common_splits(self, collections: List[str]) -> int:
+        """
+        Fix the common word run-ons inside MongoDB, so documents whose only
+        issue they are never travel to Python; returns documents modified
+        """
+        if not (self.mongodb_manager and self.mongodb_manager.connected):
+            return 0
+        
+        # Longest run-ons first, matching the order the enhancer applies them in
+        pipeline = [
+            {"$set": {"content": {"$replaceAll": {
+                "input": "$content", "find": run_on, "replacement": _COMMON_SPLITS[run_on]
+            }}}}
+            for run_on in sorted(_COMMON_SPLITS, key=len, reverse=True)
+        ]
+        query = {"content": {"$regex": _RE_COMMON_SPLIT.pattern}}
+        
+        modified = 0
+        for collection_name in collections:
+            result = self.mongodb_manager.update_many(collection_name, query, pipeline)
+            if result["success"]:
+                modified += result["modified"]
+                print(f"  - Split run-on words in {result['modified']} documents in mongodb:{collection_name}")
+            else:
+                print(f"⚠️ Could not split run-on words in mongodb:{collection_name}: {result['error']}")
+        
+        return modified
+    
     def scan_collections(self, database_type: str, collections: List[str], 
-                       threshold: int = 75, limit: int = 100) -> Dict[str, Any]:
+                       threshold: int = 75, limit: int = 100,
+                       trust_index: bool = False) -> Dict[str, Any]:
         """
         Scan collections for content below quality threshold
+        
+        With trust_index, MongoDB skips documents an earlier run already
+        enhanced to the threshold, trusting their stored quality score instead
+        of fetching them to check that their content is unchanged.
         """
         results = {
             "total_scanned": 0,
             "below_threshold": 0,
+            "issue_counts": Counter(),
             "collections": {},
             "documents": []
         }
@@ -363,32 +729,57 @@ class DatabaseContentEnhancer:
                     print(f"📊 Scanning MongoDB collection: {collection_name}")
                     collection = self.mongodb_manager.database[collection_name]
                     
-                    # Get total document count
-                    total_docs = collection.count_documents({})
+                    # Get total document count (from collection metadata, no scan)
+                    total_docs = collection.estimated_document_count()
                     scanned = 0
                     below_threshold = 0
                     
-                    # Process in batches to avoid memory issues
-                    batch_size = min(limit, 100)  # Process up to 100 at a time
-                    for doc in collection.find({}).limit(limit):
-                        scanned += 1
-                        content = doc.get("content", "")
-                        
-                        # Analyze quality
-                        quality = self.enhancer.analyze_quality(content)
-                        
-                        if quality["quality_score"] < threshold:
-                            below_threshold += 1
-                            results["documents"].append({
-                                "database": "mongodb",
-                                "collection": collection_name,
-                                "document_id": doc.get("_id"),
-                                "quality_score": quality["quality_score"],
-                                "issues": quality["issues"],
-                                "issue_count": quality["issue_count"],
-                                "content": content[:100] + "..." if len(content) > 100 else content
-                            })
+                    # Stream in batches to avoid memory issues
+                    batch_size = min(limit, SCAN_BATCH_SIZE)
+                    projection = {"content": 1, "metadata.content_sha1": 1, "metadata.quality_score": 1}
+                    conditions = []
+                    if trust_index:
+                        conditions.append({"$or": [
+                            {"metadata.enhanced": {"$ne": True}},
+                            {"metadata.enhanced": True, "metadata.quality_score": {"$lt": threshold}}
+                        ]})
                     
+                    # Let MongoDB drop documents that cannot score below the threshold
+                    candidate_filter = self.enhancer.candidate_filter(threshold)
+                    if candidate_filter:
+                        conditions.append(candidate_filter)
+                    
+                    query = {"$and": conditions} if len(conditions) > 1 else (conditions or [{}])[0]
+                    cursor = self.mongodb_manager.find_cursor(
+                        collection_name, query, projection, batch_size=batch_size
+                    ).limit(limit)
+                    with cursor:
+                        for doc in cursor:
+                            scanned += 1
+                            content = doc.get("content", "")
+                            
+                            # Skip documents enhanced by an earlier run and unchanged since
+                            metadata = doc.get("metadata") or {}
+                            if (not trust_index and metadata.get("quality_score", 0) >= threshold and
+                                    metadata.get("content_sha1") == _content_sha1(content)):
+                                continue
+                            
+                            # Analyze quality
+                            quality = self.enhancer.analyze_quality(content)
+                            results["issue_counts"].update(quality["issues"])
+                            
+                            if quality["quality_score"] < threshold:
+                                below_threshold += 1
+                                results["documents"].append({
+                                    "database": "mongodb",
+                                    "collection": collection_name,
+                                    "document_id": doc.get("_id"),
+                                    "quality_score": quality["quality_score"],
+                                    "issues": quality["issues"],
+                                    "issue_count": quality["issue_count"],
+                                    "content": content[:100] + "..." if len(content) > 100 else content
+                                })
+                            
                     # Add collection results
                     results["collections"][f"mongodb:{collection_name}"] = {
                         "total": total_docs,
@@ -424,6 +815,7 @@ class DatabaseContentEnhancer:
                         
                         # Analyze quality
                         quality = self.enhancer.analyze_quality(content)
+                        results["issue_counts"].update(quality["issues"])
                         
                         if quality["quality_score"] < threshold:
                             below_threshold += 1
@@ -459,30 +851,156 @@ class DatabaseContentEnhancer:
         """
         Process a batch of documents and enhance their content
         """
+        fetched, skipped = self._fetch_batch(documents)
+        results, pending_updates = self._process_batch(fetched, skipped, dry_run)
+        self._write_updates(pending_updates)
+        return results
+    
+    def enhance_pipelined(self, documents: List[Dict], batch_size: int,
+                          dry_run: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Enhance documents batch by batch, overlapping database reads and writes
+        with enhancement: a reader thread fetches the next batch and a writer
+        thread applies the previous batch's updates while the current batch
+        is enhanced. Yields the results of each batch in order; an error in
+        the reader is re-raised here.
+        """
+        # Bounded queues keep at most two batches in flight on either side
+        fetch_queue = queue.Queue(maxsize=2)
+        write_queue = queue.Queue(maxsize=2)
+        stop_reading = threading.Event()
+        
+        def reader():
+            try:
+                for i in range(0, len(documents), batch_size):
+                    if stop_reading.is_set():
+                        return
+                    fetch_queue.put(self._fetch_batch(documents[i:i + batch_size]))
+            except Exception as e:
+                # Hand the error to the consumer instead of ending the input early
+                fetch_queue.put(e)
+                return
+            fetch_queue.put(None)
+        
+        def writer():
+            while True:
+                pending_updates = write_queue.get()
+                if pending_updates is None:
+                    break
+                self._write_updates(pending_updates)
+        
+        reader_thread = threading.Thread(target=reader, name="enhance-reader", daemon=True)
+        writer_thread = threading.Thread(target=writer, name="enhance-writer", daemon=True)
+        reader_thread.start()
+        writer_thread.start()
+        
+        try:
+            while True:
+                item = fetch_queue.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                
+                fetched, skipped = item
+                results, pending_updates = self._process_batch(fetched, skipped, dry_run)
+                if pending_updates:
+                    write_queue.put(pending_updates)
+                yield results
+        finally:
+            # Stop the reader, draining the queue so it is not left blocked on put
+            stop_reading.set()
+            while reader_thread.is_alive():
+                try:
+                    fetch_queue.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            reader_thread.join()
+            
+            write_queue.put(None)
+            writer_thread.join()
+    
+    def _fetch_batch(self, documents: List[Dict]) -> Tuple[List[Tuple[Dict, str]], int]:
+        """
+        Retrieve content for a batch of documents, returning (document, content)
+        pairs and the number of documents that could not be retrieved
+        """
+        fetched = []
+        skipped = 0
+        
+        # Fetch MongoDB content with one projected query per collection
+        mongodb_contents: Dict[str, Dict[Any, str]] = {}
+        if self.mongodb_manager and self.mongodb_manager.connected:
+            ids_by_collection: Dict[str, List[Any]] = {}
+            for doc in documents:
+                if doc["database"] == "mongodb":
+                    ids_by_collection.setdefault(doc["collection"], []).append(doc["document_id"])
+            
+            for collection, doc_ids in ids_by_collection.items():
+                try:
+                    with self.mongodb_manager.find_cursor(
+                        collection, {"_id": {"$in": doc_ids}}, {"content": 1}, batch_size=len(doc_ids)
+                    ) as cursor:
+                        mongodb_contents[collection] = {d["_id"]: d.get("content", "") for d in cursor}
+                except Exception as e:
+                    print(f"❌ Error getting content from mongodb:{collection}: {e}")
+        
+        # Fetch ChromaDB content with one get-by-ID request per collection
+        chromadb_contents: Dict[str, Dict[Any, str]] = {}
+        if self.chromadb_manager:
+            chroma_ids: Dict[str, List[Any]] = {}
+            for doc in documents:
+                if doc["database"] == "chromadb":
+                    chroma_ids.setdefault(doc["collection"], []).append(doc["document_id"])
+            
+            for collection, doc_ids in chroma_ids.items():
+                chromadb_contents[collection] = self._chromadb_contents(collection, doc_ids)
+        
+        for doc in documents:
+            if doc["database"] == "mongodb":
+                content = mongodb_contents.get(doc["collection"], {}).get(doc["document_id"], "")
+            elif doc["database"] == "chromadb":
+                content = chromadb_contents.get(doc["collection"], {}).get(doc["document_id"], "")
+            else:
+                content = self._get_document_content(doc["database"], doc["collection"], doc["document_id"])
+            
+            if not content:
+                print(f"⚠️ Could not retrieve content for document {doc['document_id']} "
+                      f"in {doc['database']}:{doc['collection']}")
+                skipped += 1
+                continue
+            
+            fetched.append((doc, content))
+        
+        return fetched, skipped
+    
+    def _process_batch(self, fetched: List[Tuple[Dict, str]], skipped: int,
+                       dry_run: bool) -> Tuple[Dict[str, Any], Dict[str, List[Any]]]:
+        """
+        Enhance fetched content, returning batch results and the pending
+        MongoDB updates grouped by collection
+        """
         results = {
-            "total": len(documents),
+            "total": len(fetched) + skipped,
             "enhanced": 0,
-            "skipped": 0,
+            "skipped": skipped,
             "dry_run": dry_run,
             "documents": []
         }
         
-        for doc in documents:
+        # MongoDB updates are grouped per collection and sent as one bulk write
+        pending_updates: Dict[str, List[Any]] = {}
+        
+        # Enhance content and get comparison metrics (in parallel when workers > 1)
+        enhancements = self._enhance_contents([content for _, content in fetched])
+        
+        # One enhancement timestamp for the whole batch
+        enhanced_at = datetime.now(timezone.utc).isoformat()
+        
+        for (doc, content), (enhanced_content, metrics, comparison) in zip(fetched, enhancements):
             database = doc["database"]
             collection = doc["collection"]
             doc_id = doc["document_id"]
-            content = self._get_document_content(database, collection, doc_id)
-            
-            if not content:
-                print(f"⚠️ Could not retrieve content for document {doc_id} in {database}:{collection}")
-                results["skipped"] += 1
-                continue
-            
-            # Enhance content
-            enhanced_content, metrics = self.enhancer.enhance_text(content)
-            
-            # Get comparison metrics
-            comparison = self.enhancer.get_before_after_comparison(content, enhanced_content)
             
             document_result = {
                 "database": database,
@@ -502,8 +1020,14 @@ class DatabaseContentEnhancer:
                 results["enhanced"] += 1
                 
                 # Update document if not a dry run
-                if not dry_run:
-                    self._update_document_content(database, collection, doc_id, enhanced_content)
+                if not dry_run and database == "mongodb":
+                    pending_updates.setdefault(collection, []).append(UpdateOne(
+                        {"_id": doc_id},
+                        self._content_update(enhanced_content, document_result["quality_after"], enhanced_at)
+                    ))
+                elif not dry_run:
+                    self._update_document_content(database, collection, doc_id, enhanced_content,
+                                                  document_result["quality_after"], enhanced_at)
                     print(f"✅ Enhanced document {doc_id} in {database}:{collection}")
                 else:
                     print(f"📝 Would enhance document {doc_id} in {database}:{collection} (dry run)")
@@ -511,7 +1035,46 @@ class DatabaseContentEnhancer:
                 results["skipped"] += 1
                 print(f"⏩ No changes needed for document {doc_id} in {database}:{collection}")
         
-        return results
+        return results, pending_updates
+    
+    def _write_updates(self, pending_updates: Dict[str, List[Any]]):
+        """
+        Apply pending MongoDB updates with one bulk write per collection
+        """
+        for collection, operations in pending_updates.items():
+            write_result = self.mongodb_manager.bulk_write(collection, operations, ordered=False)
+            if write_result["success"]:
+                print(f"✅ Enhanced {write_result['modified']} documents in mongodb:{collection}")
+            else:
+                print(f"❌ Error updating mongodb:{collection}: {write_result['error']}")
+        
+        # The operations hold full enhanced content; release it now rather than
+        # when the caller's next batch replaces its reference
+        pending_updates.clear()
+    
+    def _enhance_contents(self, contents: List[str]) -> List[Tuple[str, Dict[str, Any], Dict[str, Any]]]:
+        """
+        Enhance a batch of contents, fanning out to worker processes when configured
+        """
+        if self.workers <= 1 or len(contents) <= 1:
+            # Bind this process's enhancer once for the whole batch
+            return list(map(partial(_enhance_payload, enhancer=self.enhancer), contents))
+        
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker, initargs=(self.debug,)
+            )
+        
+        chunksize = max(1, len(contents) // self.workers)
+        return list(self._executor.map(_enhance_payload, contents, chunksize=chunksize))
+    
+    def close(self):
+        """
+        Shut down the worker pool, if one was started
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
     
     def backup_collection(self, database_type: str, collection_name: str, output_dir: Path) -> bool:
         """
@@ -522,22 +1085,26 @@ class DatabaseContentEnhancer:
         
         if database_type == "mongodb" and self.mongodb_manager and self.mongodb_manager.connected:
             try:
-                collection = self.mongodb_manager.database[collection_name]
                 backup_file = output_dir / f"mongodb_{collection_name}_backup_{timestamp}.json"
                 
-                # Get all documents
-                docs = list(collection.find({}))
-                
-                # Convert ObjectId to string for JSON serialization
-                for doc in docs:
-                    if "_id" in doc and not isinstance(doc["_id"], str):
-                        doc["_id"] = str(doc["_id"])
-                
-                # Save as JSON
-                with open(backup_file, 'w', encoding='utf-8') as f:
-                    json.dump(docs, f, ensure_ascii=False, indent=2)
+                # Stream documents straight to the JSON array on disk
+                doc_count = 0
+                with open(backup_file, 'wb') as f, \
+                        self.mongodb_manager.find_cursor(collection_name, {},
+                                                         batch_size=BACKUP_BATCH_SIZE) as cursor:
+                    f.write(b"[\n")
+                    for doc in cursor:
+                        # Convert ObjectId to string for JSON serialization
+                        if "_id" in doc and not isinstance(doc["_id"], str):
+                            doc["_id"] = str(doc["_id"])
+                        
+                        if doc_count:
+                            f.write(b",\n")
+                        f.write(_json_dumpb(doc, indent=True))
+                        doc_count += 1
+                    f.write(b"\n]\n")
                 
-                print(f"✅ Backed up {len(docs)} documents from MongoDB:{collection_name} to {backup_file}")
+                print(f"✅ Backed up {doc_count} documents from MongoDB:{collection_name} to {backup_file}")
                 return True
             
             except Exception as e:
@@ -556,8 +1123,8 @@ class DatabaseContentEnhancer:
                 backup_file = output_dir / f"chromadb_{collection_name}_backup_{timestamp}.json"
                 
                 # Save as JSON
-                with open(backup_file, 'w', encoding='utf-8') as f:
-                    json.dump(docs, f, ensure_ascii=False, indent=2)
+                with open(backup_file, 'wb') as f:
+                    f.write(_json_dumpb(docs, indent=True))
                 
                 print(f"✅ Backed up {len(docs)} documents from ChromaDB:{collection_name} to {backup_file}")
                 return True
@@ -575,24 +1142,33 @@ class DatabaseContentEnhancer:
         try:
             if database == "mongodb" and self.mongodb_manager and self.mongodb_manager.connected:
                 collection_obj = self.mongodb_manager.database[collection]
-                doc = collection_obj.find_one({"_id": doc_id})
+                doc = collection_obj.find_one({"_id": doc_id}, {"content": 1})
                 if doc:
                     return doc.get("content", "")
             
             elif database == "chromadb" and self.chromadb_manager:
-                # This is an inefficient way to get a single document but works for this tool
-                docs = self.chromadb_manager.browse_collection(collection, limit=1000)
-                for doc in docs:
-                    if doc.get("id") == doc_id:
-                        return doc.get("content", doc.get("document", ""))
+                return self._chromadb_contents(collection, [doc_id]).get(doc_id, "")
         
         except Exception as e:
             print(f"❌ Error getting content: {e}")
         
         return ""
     
+    def _chromadb_contents(self, collection: str, doc_ids: List[Any]) -> Dict[Any, str]:
+        """
+        Map the given document IDs to their content in a ChromaDB collection
+        """
+        try:
+            docs = self.chromadb_manager.get_documents(collection, doc_ids)
+        except Exception as e:
+            print(f"❌ Error getting content from chromadb:{collection}: {e}")
+            return {}
+        
+        return {doc.get("id"): doc.get("content", doc.get("document", "")) for doc in docs}
+    
     def _update_document_content(self, database: str, collection: str, 
-                              doc_id: str, content: str) -> bool:
+                              doc_id: str, content: str, quality_score: float,
+                              enhanced_at: Optional[str] = None) -> bool:
         """
         Update document content in database
         """
@@ -600,14 +1176,7 @@ class DatabaseContentEnhancer:
             if database == "mongodb" and self.mongodb_manager and self.mongodb_manager.connected:
                 collection_obj = self.mongodb_manager.database[collection]
                 result = collection_obj.update_one(
-                    {"_id": doc_id}, 
-                    {
-                        "$set": {
-                            "content": content,
-                            "metadata.enhanced": True,
-                            "metadata.enhanced_at": datetime.now().isoformat()
-                        }
-                    }
+                    {"_id": doc_id}, self._content_update(content, quality_score, enhanced_at)
                 )
                 return result.modified_count > 0
             
@@ -623,27 +1192,107 @@ class DatabaseContentEnhancer:
         
         return False
     
-    def generate_report(self, results: Dict[str, Any], output_dir: Path) -> Path:
+    def _content_update(self, content: str, quality_score: float,
+                        enhanced_at: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build the MongoDB update document for enhanced content, stamped with
+        the batch's enhancement time (or the current time if none is given)
+        """
+        if enhanced_at is None:
+            enhanced_at = datetime.now(timezone.utc).isoformat()
+        
+        return {
+            "$set": {
+                "content": content,
+                "metadata.enhanced": True,
+                "metadata.enhanced_at": enhanced_at,
+                "metadata.content_sha1": _content_sha1(content),
+                "metadata.quality_score": int(round(quality_score))
+            }
+        }
+    
+    @staticmethod
+    def _improvement(doc: Dict[str, Any]) -> float:
+        """
+        Quality score gained by enhancing a document
+        """
+        return doc["quality_after"] - doc["quality_before"]
+    
+    def generate_report(self, results: Dict[str, Any], output_dir: Path,
+                        batches: Optional[Iterable[Dict[str, Any]]] = None) -> Path:
         """
         Generate a comprehensive report of enhancement results
+        
+        When batch results are given, their documents are written to the report
+        as each batch completes and their counts are tallied into results, so
+        per-document results are never held in memory for the whole run.
         """
         output_dir.mkdir(parents=True, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_file = output_dir / f"enhancement_report_{timestamp}.json"
         
-        # Add timestamp and summary to results
-        results["report_generated"] = datetime.now().isoformat()
-        results["summary"] = {
-            "total_documents": results.get("total", 0),
-            "enhanced_documents": results.get("enhanced", 0),
-            "skipped_documents": results.get("skipped", 0),
-            "enhancement_rate": (results.get("enhanced", 0) / results.get("total", 1)) * 100,
-            "dry_run": results.get("dry_run", True)
-        }
+        if batches is None:
+            batches = [results]
+        else:
+            for key in ("total", "enhanced", "skipped"):
+                results.setdefault(key, 0)
+        documents = results.pop("documents", [])
         
-        # Save report as JSON
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
+        scores = {"quality_before": _ScoreAccumulator(), "quality_after": _ScoreAccumulator()}
+        top_improvements = []
+        with open(report_file, 'w', encoding='utf-8', buffering=REPORT_BUFFER_SIZE) as f:
+            # Stream the documents array first, one compact JSON object per line
+            f.write('{\n  "documents": [')
+            doc_count = 0
+            for batch_results in batches:
+                if batch_results is not results:
+                    for key in ("total", "enhanced", "skipped"):
+                        results[key] += batch_results[key]
+                    documents = batch_results["documents"]
+                
+                for doc in documents:
+                    f.write(",\n    " if doc_count else "\n    ")
+                    f.write(_json_dumps(doc))
+                    for key, accumulator in scores.items():
+                        accumulator.add(doc[key])
+                    doc_count += 1
+                
+                # Keep only the running top few instead of sorting every document
+                top_improvements = heapq.nlargest(
+                    TOP_IMPROVEMENTS, chain(top_improvements, documents), key=self._improvement
+                )
+            f.write("\n  ]" if doc_count else "]")
+            
+            # Add timestamp and summary to results
+            results["report_generated"] = datetime.now().isoformat()
+            results["summary"] = {
+                "total_documents": results.get("total", 0),
+                "enhanced_documents": results.get("enhanced", 0),
+                "skipped_documents": results.get("skipped", 0),
+                "enhancement_rate": (results.get("enhanced", 0) / results.get("total", 1)) * 100,
+                "dry_run": results.get("dry_run", True)
+            }
+            
+            if doc_count:
+                results["summary"]["quality_stats"] = {
+                    key: accumulator.stats() for key, accumulator in scores.items()
+                }
+                results["summary"]["top_improvements"] = [
+                    {
+                        "database": doc["database"],
+                        "collection": doc["collection"],
+                        "document_id": doc["document_id"],
+                        "quality_before": doc["quality_before"],
+                        "quality_after": doc["quality_after"],
+                        "improvement": self._improvement(doc)
+                    }
+                    for doc in top_improvements
+                ]
+            
+            for key, value in results.items():
+                value_json = _json_dumps(value, indent=True)
+                f.write(f",\n  {_json_dumps(key)}: {value_json.replace(chr(10), chr(10) + '  ')}")
+            f.write("\n}\n")
         
         print(f"✅ Report generated: {report_file}")
         return report_file
@@ -668,6 +1317,17 @@ def parse_args():
     parser.add_argument("--batch-size", "-b", type=int, default=10,
                       help="Batch size for enhancement (default: 10)")
     
+    parser.add_argument("--workers", "-w", type=int, default=1,
+                      help="Worker processes for text enhancement (default: 1)")
+    
+    parser.add_argument("--trust-index", action="store_true",
+                      help="Let MongoDB skip documents already enhanced above the threshold "
+                           "without re-checking their content")
+    
+    parser.add_argument("--server-side-splits", action="store_true",
+                      help="Fix common word run-ons inside MongoDB before scanning "
+                           "(requires MongoDB 4.4+; ignored with --dry-run)")
+    
     parser.add_argument("--dry-run", action="store_true", 
                       help="Preview changes without applying them")
     
@@ -691,7 +1351,7 @@ def main():
     print(f"====================================")
     
     # Create enhancer
-    enhancer = DatabaseContentEnhancer(debug=args.debug)
+    enhancer = DatabaseContentEnhancer(debug=args.debug, workers=args.workers)
     
     # Check database connections
     if args.database in ["mongodb", "both"] and not enhancer.mongodb_manager:
@@ -738,15 +1398,23 @@ def main():
             if args.database in ["chromadb", "both"] and enhancer.chromadb_manager:
                 enhancer.backup_collection("chromadb", collection, args.output_dir)
     
+    if args.trust_index and args.database in ["mongodb", "both"]:
+        enhancer.ensure_indexes(collections)
+    
+    if args.server_side_splits and args.database in ["mongodb", "both"] and not args.dry_run:
+        print(f"\n✂️ Splitting common run-on words in MongoDB...")
+        enhancer.apply_common_splits(collections)
+    
     # Scan collections for low quality content
     print(f"\n🔍 Scanning collections for content below {args.threshold}% quality...")
-    scan_results = enhancer.scan_collections(args.database, collections, args.threshold, args.limit)
+    scan_results = enhancer.scan_collections(args.database, collections, args.threshold, args.limit,
+                                             trust_index=args.trust_index)
     
     # Generate scan report
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     scan_report_file = args.output_dir / f"scan_report_{timestamp}.json"
     with open(scan_report_file, 'w', encoding='utf-8') as f:
-        json.dump(scan_results, f, ensure_ascii=False, indent=2)
+        f.write(_json_dumps(scan_results, indent=True))
     
     print(f"\n📊 Scan Summary:")
     print(f"  - Total documents scanned: {scan_results['total_scanned']}")
@@ -756,6 +1424,9 @@ def main():
         percent = (scan_results['below_threshold'] / scan_results['total_scanned']) * 100
         print(f"  - Percentage: {percent:.1f}%")
     
+    for issue, count in scan_results['issue_counts'].most_common():
+        print(f"  - {issue}: {count} documents")
+    
     print(f"  - Scan report saved to: {scan_report_file}")
     
     # Exit if nothing to enhance
@@ -773,25 +1444,21 @@ def main():
         "total": 0,
         "enhanced": 0,
         "skipped": 0,
-        "dry_run": args.dry_run,
-        "documents": []
+        "dry_run": args.dry_run
     }
     
-    for i in range(0, len(documents_to_enhance), args.batch_size):
-        batch = documents_to_enhance[i:i+args.batch_size]
-        print(f"\n🔄 Processing batch {i//args.batch_size + 1}/{total_batches} ({len(batch)} documents)...")
-        
-        # Process batch
-        batch_results = enhancer.enhance_batch(batch, dry_run=args.dry_run)
-        
-        # Update overall results
-        all_results["total"] += batch_results["total"]
-        all_results["enhanced"] += batch_results["enhanced"]
-        all_results["skipped"] += batch_results["skipped"]
-        all_results["documents"].extend(batch_results["documents"])
+    def report_progress(batches):
+        for batch_num, batch_results in enumerate(batches, 1):
+            print(f"\n🔄 Processed batch {batch_num}/{total_batches} ({batch_results['total']} documents)")
+            yield batch_results
     
-    # Generate final report
-    report_file = enhancer.generate_report(all_results, args.output_dir)
+    # Batches are fetched and written in the background while the current one is
+    # enhanced, and each batch's documents are streamed into the report as it completes
+    batches = enhancer.enhance_pipelined(documents_to_enhance, args.batch_size, dry_run=args.dry_run)
+    try:
+        report_file = enhancer.generate_report(all_results, args.output_dir, report_progress(batches))
+    finally:
+        enhancer.close()
     
     # Print summary
     print(f"\n🎉 Enhancement Complete!")
@@ -803,6 +1470,10 @@ def main():
         percent = (all_results['enhanced'] / all_results['total']) * 100
         print(f"  - Enhancement rate: {percent:.1f}%")
     
+    for doc in all_results["summary"].get("top_improvements", []):
+        print(f"  - +{doc['improvement']:.1f} quality: {doc['document_id']} "
+              f"in {doc['database']}:{doc['collection']}")
+    
     if args.dry_run:
         print(f"\n⚠️ This was a dry run. No changes were applied.")
         print(f"  - Run without --dry-run to apply changes")
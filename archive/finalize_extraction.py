@@ -4,230 +4,645 @@ Finalize AD&D Extraction
 Convert the improved extraction to final database formats
 """
 
+import io
 import json
+import re
 import sys
-from pathlib import Path
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List
+from functools import partial
+from itertools import count, islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# orjson encodes the output documents in C; fall back to the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ijson decodes the input one section at a time (--stream)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# ChromaDB manager for adding documents directly (--direct-chroma)
+try:
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+    from Modules.multi_collection_manager import MultiGameCollectionManager
+    CHROMADB_AVAILABLE = True
+except ImportError:
+    CHROMADB_AVAILABLE = False
+
+# MongoDB manager for inserting documents directly (--direct-mongo)
+try:
+    from pymongo import InsertOne
+    from Modules.mongodb_manager import MongoDBManager
+    MONGODB_AVAILABLE = True
+except ImportError:
+    MONGODB_AVAILABLE = False
+
+# Documents sent per ChromaDB add request with --direct-chroma
+CHROMA_BATCH_SIZE = 200
+
+# Documents sent per unordered MongoDB bulk write with --direct-mongo
+MONGO_BATCH_SIZE = 1000
+
+# Fields indexed on the --direct-mongo collection before inserting
+MONGO_INDEX_FIELDS = ('source', 'page', 'category')
+
+# Consecutive sections built and encoded per unit of work (per pool task with --workers)
+SECTIONS_PER_TASK = 32
+
+# Pool tasks submitted ahead of the run being written, per worker
+TASKS_AHEAD_PER_WORKER = 2
+
+# Write buffer for the output files, so streamed documents are flushed in large chunks
+OUTPUT_BUFFER_SIZE = 1 << 20
 
-def finalize_extraction(improved_json: str):
-    """Convert improved extraction to final formats"""
+# Common dice patterns, compiled once at import
+_DICE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'd(\d+)',       # d20, d100, etc.
+    r'(\d+)d(\d+)',  # 3d6, 2d4, etc.
+    r'(\d+)-(\d+)',  # ranges like 01-05
+))
+
+def finalize_extraction(improved_json: str, chroma_collection: Optional[str] = None,
+                        workers: int = 1, stream: bool = False,
+                        mongo_collection: Optional[str] = None,
+                        deterministic_ids: Optional[bool] = None):
+    """
+    Convert improved extraction to final formats
+    
+    With chroma_collection, the ChromaDB documents are added straight to that
+    collection in batches instead of being written to chromadb_final.json.
+    With mongo_collection, the MongoDB documents are bulk inserted into that
+    collection instead of being written to mongodb_final.jsonl.
+    deterministic_ids gives the MongoDB documents stable string _ids for
+    idempotent reimports; by default they do, except with mongo_collection,
+    where MongoDB assigns ObjectIds. The tables file is always for
+    mongoimport, so its documents always keep their string _ids.
+    With workers > 1, sections are built and encoded in that many processes.
+    With stream, sections are decoded one at a time with ijson instead of
+    loading the whole file, so memory stays flat for very large extractions.
+    """
     
     print(f"🔧 Finalizing extraction from: {improved_json}")
     
-    with open(improved_json, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    sections = data.get('sections', [])
-    metadata = data.get('metadata', {})
-    
-    print(f"📄 Processing {len(sections)} sections")
-    
-    # Count tables
-    total_tables = sum(len(section.get('tables', [])) for section in sections)
-    print(f"📊 Found {total_tables} tables total")
-    
-    # Create final MongoDB format
-    mongodb_docs = create_mongodb_format(sections, metadata)
-    
-    # Create final ChromaDB format  
-    chromadb_docs = create_chromadb_format(sections, metadata)
+    if stream and not IJSON_AVAILABLE:
+        print("⚠️  ijson not installed, loading the whole file (pip install ijson)")
+        stream = False
     
-    # Create table-focused collection
-    table_docs = create_table_collection(sections, metadata)
+    if stream:
+        metadata = stream_json_item(Path(improved_json), 'metadata', {})
+        sections = stream_json_items(Path(improved_json), 'sections.item')
+        print(f"📄 Streaming sections")
+    else:
+        data = load_json(Path(improved_json))
+        
+        sections = data.get('sections', [])
+        metadata = data.get('metadata', {})
+        
+        print(f"📄 Processing {len(sections)} sections")
+        
+        # Count tables
+        total_tables = sum(len(section.get('tables', [])) for section in sections)
+        print(f"📊 Found {total_tables} tables total")
     
-    # Save all formats
     output_dir = Path(improved_json).parent
-    
-    # MongoDB ready
-    mongodb_file = output_dir / "mongodb_final.json"
-    with open(mongodb_file, 'w', encoding='utf-8') as f:
-        json.dump(mongodb_docs, f, indent=2, ensure_ascii=False)
-    print(f"💾 Saved MongoDB format: {mongodb_file}")
-    
-    # ChromaDB ready
+    mongodb_file = output_dir / "mongodb_final.jsonl"
     chromadb_file = output_dir / "chromadb_final.json" 
-    with open(chromadb_file, 'w', encoding='utf-8') as f:
-        json.dump(chromadb_docs, f, indent=2, ensure_ascii=False)
-    print(f"🔍 Saved ChromaDB format: {chromadb_file}")
-    
-    # Tables collection
-    tables_file = output_dir / "tables_collection.json"
-    with open(tables_file, 'w', encoding='utf-8') as f:
-        json.dump(table_docs, f, indent=2, ensure_ascii=False)
+    tables_file = output_dir / "tables_collection.jsonl"
+    
+    if deterministic_ids is None:
+        deterministic_ids = not mongo_collection
+    
+    # One creation time for every document of this run
+    now_iso = datetime.now().isoformat()
+    
+    # One pass over the sections builds all three formats and the report
+    # statistics, a run of sections at a time; runs are written in order
+    stats = new_report_stats()
+    if chroma_collection:
+        chromadb_writer = ChromaBatchWriter(chroma_collection)
+    else:
+        chromadb_writer = JsonArrayWriter(chromadb_file)
+    if mongo_collection:
+        mongodb_writer = MongoBatchWriter(mongo_collection)
+    else:
+        mongodb_writer = JsonLinesWriter(mongodb_file)
+    
+    starts = count(0, SECTIONS_PER_TASK)
+    chunks = iter_chunks(sections, SECTIONS_PER_TASK)
+    build = partial(build_section_outputs, metadata=metadata, now_iso=now_iso,
+                    encode_chromadb=not chroma_collection,
+                    encode_mongodb=not mongo_collection,
+                    deterministic_ids=deterministic_ids)
+    
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        if executor:
+            outputs = map_bounded(executor, build, chunks, starts,
+                                  window=workers * TASKS_AHEAD_PER_WORKER)
+        else:
+            outputs = map(build, chunks, starts)
+        
+        with mongodb_writer as mongodb_out, \
+                chromadb_writer as chromadb_out, \
+                JsonLinesWriter(tables_file) as tables_out:
+            for mongodb_docs, chromadb_docs, table_docs, chunk_stats in outputs:
+                for doc in mongodb_docs:
+                    if mongo_collection:
+                        mongodb_out.write(doc)
+                    else:
+                        mongodb_out.write_encoded(doc)
+                for doc in chromadb_docs:
+                    if chroma_collection:
+                        chromadb_out.write(doc)
+                    else:
+                        chromadb_out.write_encoded(doc)
+                for encoded in table_docs:
+                    tables_out.write_encoded(encoded)
+                
+                merge_report_stats(stats, chunk_stats)
+    finally:
+        if executor:
+            executor.shutdown()
+    
+    if stream:
+        print(f"📄 Processed {stats['total_sections']} sections")
+        print(f"📊 Found {stats['total_tables']} tables total")
+    
+    if mongo_collection:
+        print(f"💾 Inserted {mongodb_writer.inserted} of {mongodb_writer.count} documents "
+              f"into MongoDB collection: {mongo_collection}")
+        mongodb_file = None
+    else:
+        print(f"💾 Saved MongoDB format: {mongodb_file}")
+    if chroma_collection:
+        print(f"🔍 Added {chromadb_writer.added} of {chromadb_writer.count} documents "
+              f"to ChromaDB collection: {chroma_collection}")
+        chromadb_file = None
+    else:
+        print(f"🔍 Saved ChromaDB format: {chromadb_file}")
     print(f"📊 Saved tables collection: {tables_file}")
     
     # Generate summary report
-    generate_summary_report(sections, metadata, output_dir)
+    generate_summary_report(sections, metadata, output_dir, now_iso, stats)
     
     return {
         'mongodb_file': mongodb_file,
         'chromadb_file': chromadb_file,
         'tables_file': tables_file,
-        'total_sections': len(sections),
-        'total_tables': total_tables
+        'chroma_collection': chroma_collection,
+        'mongo_collection': mongo_collection,
+        'total_sections': stats['total_sections'],
+        'total_tables': stats['total_tables']
     }
 
-def create_mongodb_format(sections: List[Dict], metadata: Dict) -> List[Dict]:
-    """Create MongoDB-ready documents"""
-    mongodb_docs = []
+def load_json(path: Path) -> Dict:
+    """Decode a JSON file, in C with orjson when available"""
+    raw = path.read_bytes()
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity, which only the stdlib decoder accepts
+    return json.loads(raw)
+
+def stream_json_items(path: Path, prefix: str) -> Iterator[Any]:
+    """Decode the items under prefix (e.g. 'sections.item') one at a time with ijson"""
+    with open(path, 'rb') as f:
+        yield from ijson.items(f, prefix, use_float=True)
+
+def stream_json_item(path: Path, prefix: str, default: Any = None) -> Any:
+    """Decode the first value under prefix with ijson, or default if there is none"""
+    return next(stream_json_items(path, prefix), default)
+
+def iter_chunks(items: Iterable, size: int) -> Iterator[List]:
+    """Split items into consecutive lists of up to size items"""
+    items = iter(items)
+    while chunk := list(islice(items, size)):
+        yield chunk
+
+def map_bounded(executor: ProcessPoolExecutor, fn, *iterables: Iterable,
+                window: int) -> Iterator[Any]:
+    """
+    Like executor.map, but only window tasks are submitted ahead of the
+    result being consumed, so the inputs are read (and the outputs held)
+    a few runs at a time rather than all at once
+    """
+    pending = deque()
+    for args in zip(*iterables):
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, *args))
+    while pending:
+        yield pending.popleft().result()
+
+def dump_json(doc: Dict) -> bytes:
+    """Encode a document as compact UTF-8 JSON"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(doc)
+    return json.dumps(doc, ensure_ascii=False).encode('utf-8')
+
+def build_section_outputs(sections: List[Dict], start_index: int, metadata: Dict, now_iso: str,
+                          encode_chromadb: bool = True,
+                          encode_mongodb: bool = True,
+                          deterministic_ids: bool = True) -> Tuple[List[Any], List[Any], List[bytes], Dict]:
+    """
+    Build the MongoDB, ChromaDB and tables documents of consecutive sections,
+    encoded as JSON (MongoDB/ChromaDB documents stay dicts unless
+    encode_mongodb/encode_chromadb), plus their report statistics;
+    start_index is the first section's index, and deterministic_ids
+    selects string _ids over ones assigned by MongoDB for the MongoDB
+    documents (the tables documents, always written to a file, keep theirs)
+    """
+    mongodb_docs = [None] * len(sections)  # one per section
+    chromadb_docs = []
+    table_docs = []
+    stats = new_report_stats()
     
-    for i, section in enumerate(sections):
-        content = section.get('content', '')
+    for k, section in enumerate(sections):
+        i = start_index + k
         tables = section.get('tables', [])
         
-        # Create main document
-        doc = {
-            "_id": f"dmg_page_{section.get('page', i)}_{i}",
-            "source": f"AD&D {metadata.get('edition', '1st Edition')} - {metadata.get('book_type', 'DMG')}",
-            "title": section.get('title', f"Page {section.get('page', '?')}"),
-            "content": content,
-            "page": section.get('page', 0),
-            "category": section.get('category', 'General'),
-            "tags": section.get('tags', []),
-            "word_count": section.get('word_count', 0),
-            "has_tables": len(tables) > 0,
-            "table_count": len(tables),
-            "is_multi_column": section.get('is_multi_column', False),
-            "extraction_confidence": section.get('extraction_confidence', 95.0),
-            "created_at": datetime.now().isoformat(),
-            "metadata": {
-                **metadata,
-                "section_index": i,
-                "extraction_method": "text_with_improved_tables"
-            }
+        # Each table's search text is shared by the ChromaDB and tables outputs
+        search_contents = [create_table_search_content(table) for table in tables]
+        
+        mongodb_doc = mongodb_section_doc(section, tables, i, metadata, now_iso,
+                                          deterministic_ids)
+        mongodb_docs[k] = dump_json(mongodb_doc) if encode_mongodb else mongodb_doc
+        section_chromadb_docs = chromadb_section_docs(section, tables, i, metadata, search_contents)
+        chromadb_docs.extend(map(dump_json, section_chromadb_docs) if encode_chromadb
+                             else section_chromadb_docs)
+        table_docs.extend(map(dump_json, table_section_docs(section, tables, i, metadata, now_iso,
+                                                            search_contents)))
+        
+        add_section_stats(stats, section)
+    
+    return mongodb_docs, chromadb_docs, table_docs, stats
+
+class JsonArrayWriter:
+    """Stream documents into a JSON array file, one document per line"""
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self.count = 0
+        self._file = None
+    
+    def __enter__(self):
+        self._file = open(self.path, 'wb', buffering=OUTPUT_BUFFER_SIZE)
+        self._file.write(b'[')
+        return self
+    
+    def write(self, doc: Dict):
+        self.write_encoded(dump_json(doc))
+    
+    def write_encoded(self, encoded: bytes):
+        self._file.write(b',\n' if self.count else b'\n')
+        self._file.write(encoded)
+        self.count += 1
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._file.write(b'\n]\n' if self.count else b']\n')
+        self._file.close()
+
+class JsonLinesWriter:
+    """
+    Stream documents into a newline-delimited JSON file (one document per
+    line, as mongoimport reads without --jsonArray)
+    """
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self.count = 0
+        self._file = None
+    
+    def __enter__(self):
+        self._file = open(self.path, 'wb', buffering=OUTPUT_BUFFER_SIZE)
+        return self
+    
+    def write(self, doc: Dict):
+        self.write_encoded(dump_json(doc))
+    
+    def write_encoded(self, encoded: bytes):
+        self._file.write(encoded)
+        self._file.write(b'\n')
+        self.count += 1
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._file.close()
+
+class ChromaBatchWriter:
+    """
+    Add ChromaDB-format documents straight to a collection, buffering them
+    into batched add requests instead of one request per document
+    """
+    
+    def __init__(self, collection_name: str, batch_size: int = CHROMA_BATCH_SIZE):
+        if not CHROMADB_AVAILABLE:
+            raise RuntimeError("ChromaDB manager not available for --direct-chroma")
+        
+        self.collection_name = collection_name
+        self.batch_size = batch_size
+        self.count = 0
+        self.added = 0
+        self._manager = MultiGameCollectionManager()
+        self._ids: List[str] = []
+        self._documents: List[str] = []
+        self._metadatas: List[Dict] = []
+    
+    def __enter__(self):
+        return self
+    
+    def write(self, doc: Dict):
+        self._ids.append(doc["id"])
+        self._documents.append(doc["document"])
+        self._metadatas.append(chroma_metadata(doc.get("metadata", {})))
+        self.count += 1
+        if len(self._ids) >= self.batch_size:
+            self.flush()
+    
+    def flush(self):
+        if not self._ids:
+            return
+        
+        if self._manager.add_documents_to_collection(
+                self.collection_name, self._documents, self._metadatas, self._ids):
+            self.added += len(self._ids)
+        self._ids, self._documents, self._metadatas = [], [], []
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+
+class MongoBatchWriter:
+    """
+    Insert MongoDB-format documents straight into a collection, buffering
+    them into unordered bulk writes instead of a file for mongoimport
+    """
+    
+    def __init__(self, collection_name: str, batch_size: int = MONGO_BATCH_SIZE):
+        if not MONGODB_AVAILABLE:
+            raise RuntimeError("MongoDB manager not available for --direct-mongo")
+        
+        self.collection_name = collection_name
+        self.batch_size = batch_size
+        self.count = 0
+        self.inserted = 0
+        self._manager = MongoDBManager()
+        if not self._manager.connected:
+            raise RuntimeError("Could not connect to MongoDB for --direct-mongo")
+        self._operations: List[Any] = []
+    
+    def __enter__(self):
+        # Index before inserting so the collection is query-ready when done
+        for field in MONGO_INDEX_FIELDS:
+            self._manager.create_index(self.collection_name, [(field, 1)])
+        return self
+    
+    def write(self, doc: Dict):
+        self._operations.append(InsertOne(doc))
+        self.count += 1
+        if len(self._operations) >= self.batch_size:
+            self.flush()
+    
+    def flush(self):
+        if not self._operations:
+            return
+        
+        # Unordered: one failed insert (e.g. a duplicate _id) doesn't stop the rest
+        result = self._manager.bulk_write(self.collection_name, self._operations)
+        self.inserted += result.get('inserted', 0)
+        if not result['success']:
+            print(f"⚠️  {result['error']}")
+        self._operations = []
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            self._manager.close()
+
+def chroma_metadata(metadata: Dict) -> Dict:
+    """ChromaDB only stores scalar metadata: drop None values, stringify the rest"""
+    return {
+        key: value if isinstance(value, (str, int, float, bool)) else str(value)
+        for key, value in metadata.items()
+        if value is not None
+    }
+
+def write_json_array(path: Path, docs: Iterable[Dict]) -> int:
+    """Stream documents into a JSON array file, returning how many were written"""
+    with JsonArrayWriter(path) as writer:
+        for doc in docs:
+            writer.write(doc)
+    return writer.count
+
+def create_mongodb_format(sections: List[Dict], metadata: Dict, now_iso: Optional[str] = None,
+                          deterministic_ids: bool = True) -> Iterator[Dict]:
+    """Create MongoDB-ready documents"""
+    if now_iso is None:
+        now_iso = datetime.now().isoformat()
+    
+    for i, section in enumerate(sections):
+        yield mongodb_section_doc(section, section.get('tables', []), i, metadata, now_iso,
+                                  deterministic_ids)
+
+def mongodb_section_doc(section: Dict, tables: List[Dict], i: int, metadata: Dict,
+                        now_iso: str, deterministic_ids: bool = True) -> Dict:
+    """Create the MongoDB document for one section (without _id unless deterministic_ids)"""
+    content = section.get('content', '')
+    
+    # Create main document
+    doc = {}
+    if deterministic_ids:
+        doc["_id"] = f"dmg_page_{section.get('page', i)}_{i}"
+    doc.update({
+        "source": f"AD&D {metadata.get('edition', '1st Edition')} - {metadata.get('book_type', 'DMG')}",
+        "title": section['title'] if 'title' in section else f"Page {section.get('page', '?')}",
+        "content": content,
+        "page": section.get('page', 0),
+        "category": section.get('category', 'General'),
+        "tags": section.get('tags', []),
+        "word_count": section.get('word_count', 0),
+        "has_tables": len(tables) > 0,
+        "table_count": len(tables),
+        "is_multi_column": section.get('is_multi_column', False),
+        "extraction_confidence": section.get('extraction_confidence', 95.0),
+        "created_at": now_iso,
+        "metadata": {
+            **metadata,
+            "section_index": i,
+            "extraction_method": "text_with_improved_tables"
         }
+    })
+    
+    # Add table data if present
+    if tables:
+        doc["tables"] = tables
         
-        # Add table data if present
-        if tables:
-            doc["tables"] = tables
-            
-            # Create searchable table text
-            table_text_parts = []
-            for table in tables:
-                if table.get('headers'):
-                    table_text_parts.append(' '.join(table['headers']))
-                if table.get('rows'):
-                    for row in table['rows'][:5]:  # First 5 rows for search
-                        table_text_parts.append(' '.join(str(cell) for cell in row))
-            
-            doc["table_search_text"] = ' '.join(table_text_parts)
+        # Create searchable table text
+        search_parts = []
+        for table in tables:
+            if table.get('headers'):
+                search_parts.append(' '.join(table['headers']))
+            table_rows = table.get('rows')
+            if table_rows:
+                for row in table_rows[:5]:  # First 5 rows for search
+                    search_parts.append(' '.join(map(str, row)))
         
-        mongodb_docs.append(doc)
+        doc["table_search_text"] = ' '.join(search_parts)
     
-    return mongodb_docs
+    return doc
 
-def create_chromadb_format(sections: List[Dict], metadata: Dict) -> List[Dict]:
+def create_chromadb_format(sections: List[Dict], metadata: Dict) -> Iterator[Dict]:
     """Create ChromaDB-ready documents"""
-    chromadb_docs = []
-    
     for i, section in enumerate(sections):
-        content = section.get('content', '')
         tables = section.get('tables', [])
-        
-        # Main content document
-        doc = {
-            "id": f"dmg_content_{i}",
-            "document": content,
-            "metadata": {
-                "title": section.get('title', f"Page {section.get('page', '?')}"),
-                "page": section.get('page', 0),
-                "category": section.get('category', 'General'),
-                "tags": ','.join(section.get('tags', [])),
-                "source": f"AD&D {metadata.get('edition', '1st Edition')} DMG",
-                "content_type": "main_text",
-                "has_tables": len(tables) > 0,
-                "word_count": section.get('word_count', 0)
-            }
+        search_contents = [create_table_search_content(table) for table in tables]
+        yield from chromadb_section_docs(section, tables, i, metadata, search_contents)
+
+def chromadb_section_docs(section: Dict, tables: List[Dict], i: int, metadata: Dict,
+                          search_contents: List[str]) -> Iterator[Dict]:
+    """Create the ChromaDB documents for one section and its tables"""
+    content = section.get('content', '')
+    page = section.get('page', 0)
+    page_label = section.get('page', '?')
+    category = section.get('category', 'General')
+    tags = section.get('tags', [])
+    source = f"AD&D {metadata.get('edition', '1st Edition')} DMG"
+    
+    # Main content document
+    yield {
+        "id": f"dmg_content_{i}",
+        "document": content,
+        "metadata": {
+            "title": section['title'] if 'title' in section else f"Page {page_label}",
+            "page": page,
+            "category": category,
+            "tags": ','.join(tags),
+            "source": source,
+            "content_type": "main_text",
+            "has_tables": len(tables) > 0,
+            "word_count": section.get('word_count', 0)
         }
-        chromadb_docs.append(doc)
-        
-        # Separate documents for each table
-        for j, table in enumerate(tables):
-            table_content = create_table_search_content(table)
-            if table_content:
-                table_doc = {
-                    "id": f"dmg_table_{i}_{j}",
-                    "document": table_content,
-                    "metadata": {
-                        "title": f"Table on Page {section.get('page', '?')}",
-                        "page": section.get('page', 0),
-                        "category": section.get('category', 'General'),
-                        "tags": ','.join(section.get('tags', []) + ['table']),
-                        "source": f"AD&D {metadata.get('edition', '1st Edition')} DMG",
-                        "content_type": "table",
-                        "table_type": table.get('type', 'unknown'),
-                        "row_count": table.get('row_count', 0),
-                        "parent_section": i
-                    }
-                }
-                chromadb_docs.append(table_doc)
+    }
     
-    return chromadb_docs
+    # Separate documents for each table
+    table_title = f"Table on Page {page_label}"
+    table_tags = ','.join(tags + ['table'])
+    for j, (table, table_content) in enumerate(zip(tables, search_contents)):
+        if table_content:
+            yield {
+                "id": f"dmg_table_{i}_{j}",
+                "document": table_content,
+                "metadata": {
+                    "title": table_title,
+                    "page": page,
+                    "category": category,
+                    "tags": table_tags,
+                    "source": source,
+                    "content_type": "table",
+                    "table_type": table.get('type', 'unknown'),
+                    "row_count": table.get('row_count', 0),
+                    "parent_section": i
+                }
+            }
 
-def create_table_collection(sections: List[Dict], metadata: Dict) -> List[Dict]:
+def create_table_collection(sections: List[Dict], metadata: Dict, now_iso: Optional[str] = None,
+                            deterministic_ids: bool = True) -> Iterator[Dict]:
     """Create a dedicated tables collection"""
-    table_docs = []
+    if now_iso is None:
+        now_iso = datetime.now().isoformat()
     
     for i, section in enumerate(sections):
         tables = section.get('tables', [])
-        
-        for j, table in enumerate(tables):
-            table_doc = {
-                "_id": f"table_{i}_{j}",
-                "source_section": i,
-                "source_page": section.get('page', 0),
-                "source_title": section.get('title', ''),
-                "table_type": table.get('type', 'unknown'),
-                "table_data": table,
-                "searchable_content": create_table_search_content(table),
-                "metadata": {
-                    **metadata,
-                    "extraction_method": "improved_detection",
-                    "confidence": table.get('confidence', 0),
-                    "created_at": datetime.now().isoformat()
-                }
+        search_contents = [create_table_search_content(table) for table in tables]
+        yield from table_section_docs(section, tables, i, metadata, now_iso, search_contents,
+                                      deterministic_ids)
+
+def table_section_docs(section: Dict, tables: List[Dict], i: int, metadata: Dict, now_iso: str,
+                       search_contents: List[str], deterministic_ids: bool = True) -> Iterator[Dict]:
+    """Create the tables-collection documents for one section's tables (string _ids if deterministic_ids)"""
+    page = section.get('page', 0)
+    title = section.get('title', '')
+    for j, (table, table_content) in enumerate(zip(tables, search_contents)):
+        table_type = table.get('type')
+        table_doc = {}
+        if deterministic_ids:
+            table_doc["_id"] = f"table_{i}_{j}"
+        table_doc.update({
+            "source_section": i,
+            "source_page": page,
+            "source_title": title,
+            "table_type": table.get('type', 'unknown'),
+            "table_data": table,
+            "searchable_content": table_content,
+            "metadata": {
+                **metadata,
+                "extraction_method": "improved_detection",
+                "confidence": table.get('confidence', 0),
+                "created_at": now_iso
             }
-            
-            # Add type-specific enhancements
-            if table.get('type') == 'dice_table':
-                table_doc['is_random_table'] = True
-                table_doc['dice_type'] = extract_dice_info(table)
-            elif table.get('type') == 'combat_table':
-                table_doc['is_combat_mechanic'] = True
-            elif table.get('type') == 'level_table':
-                table_doc['is_progression_table'] = True
-            
-            table_docs.append(table_doc)
-    
-    return table_docs
+        })
+        
+        # Add type-specific enhancements
+        if table_type == 'dice_table':
+            table_doc['is_random_table'] = True
+            table_doc['dice_type'] = extract_dice_info(table)
+        elif table_type == 'combat_table':
+            table_doc['is_combat_mechanic'] = True
+        elif table_type == 'level_table':
+            table_doc['is_progression_table'] = True
+        
+        yield table_doc
 
 def create_table_search_content(table: Dict) -> str:
     """Create searchable content from table data"""
-    content_parts = []
+    buf = io.StringIO()
     
     # Add table type
     if table.get('type'):
-        content_parts.append(f"Table type: {table['type']}")
+        buf.write(f"Table type: {table['type']}\n")
     
     # Add headers
     if table.get('headers'):
-        content_parts.append("Headers: " + ' '.join(table['headers']))
+        buf.write("Headers: ")
+        buf.write(' '.join(table['headers']))
+        buf.write('\n')
     
     # Add row data (sample)
-    if table.get('rows'):
-        content_parts.append("Data:")
-        for row in table['rows'][:10]:  # First 10 rows
-            if isinstance(row, list):
-                content_parts.append(' '.join(str(cell) for cell in row))
-            else:
-                content_parts.append(str(row))
+    table_rows = table.get('rows')
+    if table_rows:
+        buf.write("Data:\n")
+        for row in table_rows[:10]:  # First 10 rows
+            buf.write(' '.join(map(str, row)) if isinstance(row, list) else str(row))
+            buf.write('\n')
     
     # Add any notes
     if table.get('note'):
-        content_parts.append(f"Note: {table['note']}")
+        buf.write(f"Note: {table['note']}\n")
     
-    return '\n'.join(content_parts)
+    # Drop the newline after the last part
+    return buf.getvalue()[:-1]
+
+def table_text_parts(table: Dict) -> Iterator[str]:
+    """Yield the text of a table's headers, cells and note"""
+    yield from map(str, table.get('headers') or ())
+    for row in table.get('rows') or ():
+        if isinstance(row, list):
+            yield from map(str, row)
+        else:
+            yield str(row)
+    if table.get('note'):
+        yield str(table['note'])
 
 def extract_dice_info(table: Dict) -> Dict:
     """Extract dice information from dice tables"""
@@ -237,59 +652,75 @@ def extract_dice_info(table: Dict) -> Dict:
         'is_percentile': False
     }
     
-    # Look through table data for dice patterns
-    content = str(table)
+    # Look through the table's text for dice patterns (not its whole repr, whose
+    # confidence and row_count numbers would be read as dice too)
+    content = ' '.join(table_text_parts(table))
     
-    # Common dice patterns
-    import re
-    dice_patterns = [
-        r'd(\d+)',      # d20, d100, etc.
-        r'(\d+)d(\d+)', # 3d6, 2d4, etc.
-        r'(\d+)-(\d+)'  # ranges like 01-05
-    ]
-    
-    for pattern in dice_patterns:
-        matches = re.findall(pattern, content)
+    for pattern in _DICE_PATTERNS:
+        matches = pattern.findall(content)
         if matches:
             dice_info['dice_types'].extend(matches)
     
-    # Check for percentile dice
-    if '00' in content or '100' in content or 'd100' in content:
+    # Check for percentile dice ('100' and 'd100' both contain '00')
+    if '00' in content:
         dice_info['is_percentile'] = True
     
     return dice_info
 
-def generate_summary_report(sections: List[Dict], metadata: Dict, output_dir: Path):
-    """Generate a comprehensive summary report"""
-    
-    # Collect statistics
-    stats = {
-        'total_sections': len(sections),
-        'total_words': sum(s.get('word_count', 0) for s in sections),
-        'total_tables': sum(len(s.get('tables', [])) for s in sections),
-        'multi_column_pages': sum(1 for s in sections if s.get('is_multi_column', False)),
-        'categories': {},
-        'table_types': {},
+def new_report_stats() -> Dict:
+    """Empty statistics for the summary report, filled by add_section_stats"""
+    return {
+        'total_sections': 0,
+        'total_words': 0,
+        'total_tables': 0,
+        'multi_column_pages': 0,
+        'categories': Counter(),
+        'table_types': Counter(),
         'pages_with_tables': 0
     }
+
+def add_section_stats(stats: Dict, section: Dict):
+    """Add one section to the summary report statistics"""
+    stats['total_sections'] += 1
+    stats['total_words'] += section.get('word_count', 0)
+    tables = section.get('tables', [])
+    stats['total_tables'] += len(tables)
+    if section.get('is_multi_column', False):
+        stats['multi_column_pages'] += 1
     
     # Category breakdown
-    for section in sections:
-        category = section.get('category', 'Unknown')
-        stats['categories'][category] = stats['categories'].get(category, 0) + 1
+    stats['categories'][section.get('category', 'Unknown')] += 1
+    
+    if tables:
+        stats['pages_with_tables'] += 1
         
-        if section.get('tables'):
-            stats['pages_with_tables'] += 1
-            
-            for table in section['tables']:
-                table_type = table.get('type', 'unknown')
-                stats['table_types'][table_type] = stats['table_types'].get(table_type, 0) + 1
+        stats['table_types'].update(table.get('type', 'unknown') for table in tables)
+
+def merge_report_stats(stats: Dict, other: Dict):
+    """Add statistics collected for other sections into stats"""
+    for key, value in other.items():
+        if isinstance(value, Counter):
+            stats[key].update(value)
+        else:
+            stats[key] += value
+
+def generate_summary_report(sections: List[Dict], metadata: Dict, output_dir: Path,
+                            now_iso: Optional[str] = None, stats: Optional[Dict] = None):
+    """Generate a comprehensive summary report (from precollected stats, if given)"""
+    if now_iso is None:
+        now_iso = datetime.now().isoformat()
+    
+    # Collect statistics
+    if stats is None:
+        stats = new_report_stats()
+        for section in sections:
+            add_section_stats(stats, section)
     
     # Create report
     report = {
         'extraction_summary': {
             'source_file': metadata.get('original_filename', 'Unknown'),
-            'extraction_date': datetime.now().isoformat(),
+            'extraction_date': now_iso,
             'extraction_method': 'text_with_improved_table_detection',
             'statistics': stats
         },
@@ -300,14 +731,14 @@ def generate_summary_report(sections: List[Dict], metadata: Dict, output_dir: Pa
             'coverage': f"{stats['pages_with_tables']} pages contain tables"
         },
         'database_files': {
-            'mongodb_ready': 'mongodb_final.json',
+            'mongodb_ready': 'mongodb_final.jsonl',
             'chromadb_ready': 'chromadb_final.json',
-            'tables_only': 'tables_collection.json'
+            'tables_only': 'tables_collection.jsonl'
         },
         'recommendations': [
-            'MongoDB: Import mongodb_final.json for full-text search capabilities',
+            'MongoDB: Import mongodb_final.jsonl for full-text search capabilities',
             'ChromaDB: Use chromadb_final.json for semantic search and embeddings',
-            'Tables: Use tables_collection.json for structured table queries',
+            'Tables: Use tables_collection.jsonl for structured table queries',
             'Quality: Review dice_table and combat_table entries for accuracy',
             'Search: Table content is included in both text and structured formats'
         ]
@@ -315,8 +746,11 @@ def generate_summary_report(sections: List[Dict], metadata: Dict, output_dir: Pa
     
     # Save report
     report_file = output_dir / "extraction_report.json"
-    with open(report_file, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    if ORJSON_AVAILABLE:
+        report_file.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
     
     print(f"📋 Generated summary report: {report_file}")
     
@@ -331,12 +765,12 @@ def generate_summary_report(sections: List[Dict], metadata: Dict, output_dir: Pa
     print(f"Multi-column pages: {stats['multi_column_pages']}")
     
     print(f"\nContent by category:")
-    for category, count in sorted(stats['categories'].items()):
-        print(f"  {category}: {count} sections")
+    for category, sections_found in sorted(stats['categories'].items()):
+        print(f"  {category}: {sections_found} sections")
     
     print(f"\nTable types found:")
-    for table_type, count in sorted(stats['table_types'].items()):
-        print(f"  {table_type}: {count} tables")
+    for table_type, tables_found in sorted(stats['table_types'].items()):
+        print(f"  {table_type}: {tables_found} tables")
     
     return report
 
@@ -345,6 +779,19 @@ def main():
     
     parser = argparse.ArgumentParser(description="Finalize AD&D extraction")
     parser.add_argument("improved_json", help="Path to improved_extraction.json")
+    parser.add_argument("--direct-chroma", metavar="COLLECTION",
+                        help="Add ChromaDB documents straight to this collection "
+                             "instead of writing chromadb_final.json")
+    parser.add_argument("--direct-mongo", metavar="COLLECTION",
+                        help="Bulk insert MongoDB documents straight into this collection "
+                             "instead of writing mongodb_final.jsonl")
+    parser.add_argument("--deterministic-ids", action="store_true",
+                        help="Give MongoDB documents stable string _ids with --direct-mongo "
+                             "(default there: ObjectIds assigned by MongoDB)")
+    parser.add_argument("--workers", "-w", type=int, default=1,
+                        help="Worker processes for building documents (default: 1)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Decode sections one at a time with ijson to keep memory flat")
     
     args = parser.parse_args()
     
@@ -354,22 +801,34 @@ def main():
         sys.exit(1)
     
     # Finalize the extraction
-    result = finalize_extraction(str(improved_json))
+    result = finalize_extraction(str(improved_json), chroma_collection=args.direct_chroma,
+                                 workers=args.workers, stream=args.stream,
+                                 mongo_collection=args.direct_mongo,
+                                 deterministic_ids=args.deterministic_ids or None)
     
     print(f"\n🎉 EXTRACTION FINALIZED!")
     print(f"{'='*40}")
     print(f"📁 Files ready for database import:")
-    print(f"   MongoDB: {result['mongodb_file']}")
-    print(f"   ChromaDB: {result['chromadb_file']}")
+    if result['mongodb_file']:
+        print(f"   MongoDB: {result['mongodb_file']}")
+    if result['chromadb_file']:
+        print(f"   ChromaDB: {result['chromadb_file']}")
     print(f"   Tables: {result['tables_file']}")
     
     print(f"\n💡 Next Steps:")
     print(f"1. Import to MongoDB:")
-    print(f"   mongoimport --db rpg_data --collection add_dmg --file {result['mongodb_file']} --jsonArray")
-    print(f"   mongoimport --db rpg_data --collection add_tables --file {result['tables_file']} --jsonArray")
-    
-    print(f"2. Set up ChromaDB:")
-    print(f"   Use {result['chromadb_file']} to create embeddings")
+    if result['mongodb_file']:
+        print(f"   mongoimport --db rpg_data --collection add_dmg --file {result['mongodb_file']}")
+    else:
+        print(f"   Sections were inserted into the {result['mongo_collection']} collection")
+    print(f"   mongoimport --db rpg_data --collection add_tables --file {result['tables_file']}")
+    
+    if result['chromadb_file']:
+        print(f"2. Set up ChromaDB:")
+        print(f"   Use {result['chromadb_file']} to create embeddings")
+    else:
+        print(f"2. ChromaDB:")
+        print(f"   Documents were added to the {result['chroma_collection']} collection")
     
     print(f"3. Quality check:")
     print(f"   Review the extraction_report.json for detailed statistics")
@@ -11,6 +11,14 @@ from pathlib import Path
 from typing import Dict, Any, List
 import pymongo
 from pymongo import MongoClient
+from pymongo.errors import ServerSelectionTimeoutError
+
+# orjson decodes large extraction results in C; fall back to the stdlib decoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Update path for archive location
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
@@ -21,8 +29,15 @@ def query_building_blocks_from_json(json_file: str) -> Dict[str, Any]:
     print(f"🔍 Searching for building blocks in: {json_file}")
 
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        raw = Path(json_file).read_bytes()
+        data = None
+        if ORJSON_AVAILABLE:
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # e.g. NaN/Infinity, which only the stdlib decoder accepts
+        if data is None:
+            data = json.loads(raw)
 
         # Look for building blocks in various locations
         building_blocks = None
@@ -62,9 +77,8 @@ def query_building_blocks_from_mongodb(collection_name: str = None) -> Dict[str,
     print(f"🔍 Searching for building blocks in MongoDB...")
 
     try:
-        # Connect to MongoDB
-        client = MongoClient('mongodb://10.202.28.46:27017/', serverSelectionTimeoutMS=5000)
-        client.server_info()  # Test connection
+        # Connect to MongoDB (lazily, on the first query; fails fast if unreachable)
+        client = MongoClient('mongodb://10.202.28.46:27017/', serverSelectionTimeoutMS=2000)
         db = client['rpger']
 
         # Get all collections if none specified
@@ -83,24 +97,35 @@ def query_building_blocks_from_mongodb(collection_name: str = None) -> Dict[str,
 
         collection = db[collection_name]
 
-        # Look for documents with building blocks
-        doc_with_blocks = collection.find_one({'building_blocks': {'$exists': True}})
-
-        if doc_with_blocks and 'building_blocks' in doc_with_blocks:
-            print("✅ Found building blocks in MongoDB")
-            return analyze_building_blocks(doc_with_blocks['building_blocks'])
-
-        # Look for documents with character identification containing building blocks
-        doc_with_char_id = collection.find_one({'character_identification.building_blocks': {'$exists': True}})
+        # Look for documents with building blocks, at the root or in character
+        # identification data, in one query that returns only the blocks
+        pipeline = [
+            {'$match': {'$or': [
+                {'building_blocks': {'$exists': True}},
+                {'character_identification.building_blocks': {'$exists': True}}
+            ]}},
+            {'$limit': 1},
+            {'$project': {
+                '_id': 0,
+                'at_root': {'$ne': [{'$ifNull': ['$building_blocks', None]}, None]},
+                'building_blocks': {'$ifNull': ['$building_blocks', '$character_identification.building_blocks']}
+            }}
+        ]
+        doc = next(collection.aggregate(pipeline), None)
 
-        if doc_with_char_id:
-            building_blocks = doc_with_char_id['character_identification']['building_blocks']
-            print("✅ Found building blocks in character identification data")
-            return analyze_building_blocks(building_blocks)
+        if doc and doc.get('building_blocks'):
+            if doc['at_root']:
+                print("✅ Found building blocks in MongoDB")
+            else:
+                print("✅ Found building blocks in character identification data")
+            return analyze_building_blocks(doc['building_blocks'])
 
         print("❌ No building blocks found in MongoDB")
         return {}
 
+    except ServerSelectionTimeoutError as e:
+        print(f"❌ MongoDB connection failed: {e}")
+        return {}
     except Exception as e:
         print(f"❌ MongoDB error: {e}")
         return {}
@@ -198,15 +223,15 @@ def query_dedicated_building_blocks_collection() -> Dict[str, Any]:
         # Get random blocks from different categories
         example_categories = ['physical_descriptors', 'emotional_words', 'colors', 'action_verbs']
 
-        for category in example_categories:
-            try:
-                random_blocks = blocks_manager.get_random_blocks(category, count=5)
-                if random_blocks:
+        try:
+            random_blocks = blocks_manager.get_random_blocks_by_category(example_categories, count=5)
+            for category in example_categories:
+                if random_blocks[category]:
                     print(f"\n   {category.upper().replace('_', ' ')}:")
-                    for block in random_blocks:
+                    for block in random_blocks[category]:
                         print(f"     • {block}")
-            except Exception as e:
-                print(f"   ⚠️ Could not get examples for {category}: {e}")
+        except Exception as e:
+            print(f"   ⚠️ Could not get example blocks: {e}")
 
         return stats
 
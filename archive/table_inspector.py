@@ -6,60 +6,186 @@ Analyzes extracted content to find and improve table detection
 
 import json
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count, islice
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-def analyze_extracted_content(json_file: str):
-    """Analyze the extracted content to find potential tables"""
+import numpy as np
+
+# orjson encodes the output in C; fall back to the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ijson decodes the input one section at a time (--stream)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Aho-Corasick finds every table indicator in one pass over a section;
+# fall back to one substring check per indicator
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# AD&D specific table patterns
+TABLE_INDICATORS = [
+    # Combat tables
+    'THAC0', 'Armor Class', 'To Hit', 'Saving Throw', 'Attack Roll',
+    # Character tables  
+    'Ability Score', 'Experience Points', 'Level', 'Hit Points',
+    # Magic tables
+    'Spell Level', 'Casting Time', 'Duration', 'Range',
+    # Monster tables
+    'Hit Dice', 'Armor Class', 'Movement', 'Attacks',
+    # General tables
+    'Table', 'Chart', 'Matrix', 'Random', 'Roll', 'Dice'
+]
+
+# (indicator, lowercased indicator) pairs, lowered once at import; indicators
+# listed under several table kinds (Armor Class) are only found once
+_INDICATORS_LOWER = tuple((indicator, indicator.lower()) for indicator in dict.fromkeys(TABLE_INDICATORS))
+
+# Indicators specific to AD&D tables, which add to the detection confidence
+_AD_D_INDICATORS = frozenset({'THAC0', 'Armor Class', 'Hit Dice', 'Saving Throw'})
+
+# Line patterns for each table type; a line matching any of a type's
+# patterns counts towards that type
+_DICE_PATTERNS = (
+    r'\bd\d+\b',  # d20, d100, etc.
+    r'\d+\s*-\s*\d+',  # ranges like 01-05, 15-20 (spaced or not)
+)
+
+_COMBAT_PATTERNS = (
+    r'AC\s*\d+',
+    r'THAC0\s*\d+',
+    r'\d+\s*or\s*better',
+    r'Level\s*\d+',
+    r'HD\s*\d+'
+)
+
+_LEVEL_PATTERNS = (
+    r'Level\s*\d+',
+    r'\d+st\s+Level',
+    r'\d+nd\s+Level',
+    r'\d+rd\s+Level',
+    r'\d+th\s+Level',
+    r'Experience\s*Points?',
+    r'XP\s*Required'
+)
+
+# Fewest matching lines for each line-based table type
+MIN_DICE_LINES = 5
+MIN_COMBAT_LINES = 3
+MIN_LEVEL_LINES = 4
+
+# One alternation per table type, compiled once at import
+_DICE_LINE = re.compile('|'.join(_DICE_PATTERNS))
+_COMBAT_LINE = re.compile('|'.join(_COMBAT_PATTERNS), re.IGNORECASE)
+_LEVEL_LINE = re.compile('|'.join(_LEVEL_PATTERNS), re.IGNORECASE)
+
+# Every pattern above needs a digit except these level headings, so lines
+# without one (most prose) are only checked for them
+_HAS_DIGIT = re.compile(r'\d').search
+_LEVEL_HEADING = re.compile(r'Experience\s*Points?|XP\s*Required', re.IGNORECASE)
+
+def _no_match(line: str) -> None:
+    """Stand-in search for a table type that needs no more lines"""
+    return None
+
+def _build_indicator_automaton():
+    """Build an automaton matching the lowercased table indicators"""
+    automaton = ahocorasick.Automaton()
+    for _, indicator_lower in _INDICATORS_LOWER:
+        automaton.add_word(indicator_lower, indicator_lower)
+    automaton.make_automaton()
+    return automaton
+
+_INDICATOR_AUTOMATON = _build_indicator_automaton() if AHOCORASICK_AVAILABLE else None
+
+# Consecutive sections analyzed per unit of work (per pool task with --workers)
+SECTIONS_PER_TASK = 32
+
+# Pool tasks submitted ahead of the run being collected, per worker
+TASKS_AHEAD_PER_WORKER = 2
+
+# Sections with more lines than this count each line's digits with numpy
+NUMPY_LINE_THRESHOLD = 500
+
+# Finds an ASCII digit in a token
+_ASCII_DIGIT = re.compile(r'[0-9]').search
+
+# Dice table row: a roll or roll range followed by its result. Matched over
+# the whole content: the gap never crosses a newline and the result runs to
+# the end of the line, so each line yields at most its first row. A roll
+# never starts mid-number (that start would have matched already), which
+# keeps long digit runs from being rescanned from every digit
+_DICE_ROW = re.compile(r'(?<!\d)(\d+[-–]\d+|\d+)[^\S\n]+(\S.*)')
+
+def analyze_extracted_content(json_file: str, stream: bool = False,
+                              analysis_cache: Optional[Dict[int, Dict]] = None,
+                              workers: int = 1):
+    """
+    Analyze the extracted content to find potential tables
+    
+    With stream, sections are decoded one at a time with ijson instead of
+    loading the whole file. Each section analysis is stored in
+    analysis_cache (by section index) if given, for extract_better_tables.
+    With workers > 1, sections are analyzed in that many processes.
+    """
     
     print(f"🔍 Analyzing extracted content from: {json_file}")
     
-    with open(json_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    sections = data.get('sections', [])
-    print(f"📄 Found {len(sections)} sections to analyze")
-    
-    # AD&D specific table patterns
-    table_indicators = [
-        # Combat tables
-        'THAC0', 'Armor Class', 'To Hit', 'Saving Throw', 'Attack Roll',
-        # Character tables  
-        'Ability Score', 'Experience Points', 'Level', 'Hit Points',
-        # Magic tables
-        'Spell Level', 'Casting Time', 'Duration', 'Range',
-        # Monster tables
-        'Hit Dice', 'Armor Class', 'Movement', 'Attacks',
-        # General tables
-        'Table', 'Chart', 'Matrix', 'Random', 'Roll', 'Dice'
-    ]
+    stream = check_stream_support(stream)
+    if stream:
+        sections = stream_json_items(json_file, 'sections.item')
+        print(f"📄 Streaming sections to analyze")
+    else:
+        with open(json_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        sections = data.get('sections', [])
+        print(f"📄 Found {len(sections)} sections to analyze")
     
     potential_tables = []
     sections_with_tables = 0
-    
-    for i, section in enumerate(sections):
-        content = section.get('content', '')
-        page = section.get('page', 'Unknown')
+    section_count = 0
+    
+    # Sections are analyzed a run at a time; runs are collected in order
+    starts = count(0, SECTIONS_PER_TASK)
+    chunks = iter_chunks(sections, SECTIONS_PER_TASK)
+    
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        if executor:
+            outputs = map_bounded(executor, analyze_section_chunk, chunks, starts,
+                                  window=workers * TASKS_AHEAD_PER_WORKER)
+        else:
+            outputs = map(analyze_section_chunk, chunks, starts)
         
-        # Look for table indicators
-        found_indicators = []
-        for indicator in table_indicators:
-            if indicator.lower() in content.lower():
-                found_indicators.append(indicator)
-        
-        if found_indicators:
-            # Analyze the content more deeply
-            table_analysis = analyze_section_for_tables(content, found_indicators)
-            
-            if table_analysis['likely_tables']:
-                sections_with_tables += 1
-                potential_tables.append({
-                    'section_index': i,
-                    'page': page,
-                    'indicators': found_indicators,
-                    'analysis': table_analysis,
-                    'content_preview': content[:200] + "..." if len(content) > 200 else content
-                })
+        for chunk_size, results in outputs:
+            section_count += chunk_size
+            for i, table_analysis, potential_table in results:
+                if analysis_cache is not None:
+                    analysis_cache[i] = table_analysis
+                
+                if potential_table:
+                    sections_with_tables += 1
+                    potential_tables.append(potential_table)
+    finally:
+        if executor:
+            executor.shutdown()
+    
+    if stream:
+        print(f"📄 Analyzed {section_count} sections")
     
     print(f"\n📊 ANALYSIS RESULTS")
     print(f"={'='*50}")
@@ -82,13 +208,103 @@ def analyze_extracted_content(json_file: str):
             all_indicators[indicator] = all_indicators.get(indicator, 0) + 1
     
     print(f"\n📈 MOST COMMON TABLE INDICATORS:")
-    for indicator, count in sorted(all_indicators.items(), key=lambda x: x[1], reverse=True)[:10]:
-        print(f"   {indicator}: {count} sections")
+    for indicator, sections_found in sorted(all_indicators.items(), key=lambda x: x[1], reverse=True)[:10]:
+        print(f"   {indicator}: {sections_found} sections")
     
     return potential_tables
 
-def analyze_section_for_tables(content: str, indicators: List[str]) -> Dict:
-    """Analyze a section to determine if it contains tables"""
+def iter_chunks(items: Iterable, size: int) -> Iterator[List]:
+    """Split items into consecutive lists of up to size items"""
+    items = iter(items)
+    while chunk := list(islice(items, size)):
+        yield chunk
+
+def map_bounded(executor: ProcessPoolExecutor, fn, *iterables: Iterable,
+                window: int) -> Iterator[Any]:
+    """
+    Like executor.map, but only window tasks are submitted ahead of the
+    result being consumed, so sections are read a few runs at a time
+    rather than all queued at once
+    """
+    pending = deque()
+    for args in zip(*iterables):
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, *args))
+    while pending:
+        yield pending.popleft().result()
+
+def analyze_section_chunk(sections: List[Dict], start_index: int) -> Tuple[int, List[Tuple[int, Dict, Optional[Dict]]]]:
+    """
+    Analyze consecutive sections with table indicators; start_index is the
+    first section's index. Returns the number of sections and, for each
+    analyzed one, its index, analysis and potential-table entry (or None)
+    """
+    results = []
+    
+    for i, section in enumerate(sections, start_index):
+        content = section.get('content', '')
+        
+        # Look for table indicators
+        found_indicators = find_table_indicators(content)
+        if not found_indicators:
+            continue
+        
+        # Analyze the content more deeply
+        table_analysis = analyze_section_for_tables(content, found_indicators)
+        
+        potential_table = None
+        if table_analysis['likely_tables']:
+            potential_table = {
+                'section_index': i,
+                'page': section.get('page', 'Unknown'),
+                'indicators': found_indicators,
+                'analysis': table_analysis,
+                'content_preview': content[:200] + "..." if len(content) > 200 else content
+            }
+        results.append((i, table_analysis, potential_table))
+    
+    return len(sections), results
+
+def find_table_indicators(content: str) -> List[str]:
+    """Find the table indicators in content (case-insensitive), in TABLE_INDICATORS order"""
+    content_lower = content.lower()
+    
+    if _INDICATOR_AUTOMATON is not None:
+        found = {key for _, key in _INDICATOR_AUTOMATON.iter(content_lower)}
+        return [indicator for indicator, indicator_lower in _INDICATORS_LOWER
+                if indicator_lower in found]
+    
+    return [indicator for indicator, indicator_lower in _INDICATORS_LOWER
+            if indicator_lower in content_lower]
+
+def has_table_indicator(content: str) -> bool:
+    """Check whether content contains any table indicator, stopping at the first"""
+    content_lower = content.lower()
+    
+    if _INDICATOR_AUTOMATON is not None:
+        return next(_INDICATOR_AUTOMATON.iter(content_lower), None) is not None
+    
+    return any(indicator_lower in content_lower for _, indicator_lower in _INDICATORS_LOWER)
+
+def ascii_line_digit_counts(content: str) -> List[int]:
+    """Count the digits on each '\\n'-separated line of ASCII content"""
+    a = np.frombuffer(content.encode('ascii'), dtype=np.uint8)
+    digit_totals = np.concatenate(([0], np.cumsum((a >= 0x30) & (a <= 0x39))))
+    newlines = np.flatnonzero(a == 0x0A)
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.append(newlines, a.size)
+    return (digit_totals[ends] - digit_totals[starts]).tolist()
+
+def analyze_section_for_tables(content: str, indicators: List[str],
+                               exact_counts: bool = True) -> Dict:
+    """
+    Analyze a section to determine if it contains tables
+    
+    Without exact_counts, dice, combat and level lines stop being searched
+    for once a type has enough to count as a table, so their line counts
+    are capped (enough for extraction, which only needs the table types).
+    """
     
     lines = content.split('\n')
     analysis = {
@@ -98,51 +314,79 @@ def analyze_section_for_tables(content: str, indicators: List[str]) -> Dict:
         'patterns_found': []
     }
     
-    # Pattern 1: Look for tabular data (multiple columns with alignment)
+    # Walk the lines once, collecting tabular rows (pattern 1) and dice,
+    # combat and level lines (patterns 2-4); a line can count for several types
     tabular_lines = []
+    dice_table_lines = []
+    combat_lines = []
+    level_lines = []
+    
+    # Each type's search is swapped for _no_match once its count is capped
+    dice_search, combat_search = _DICE_LINE.search, _COMBAT_LINE.search
+    level_search, heading_search = _LEVEL_LINE.search, _LEVEL_HEADING.search
+    if exact_counts:
+        dice_cap = combat_cap = level_cap = None
+    else:
+        dice_cap, combat_cap, level_cap = MIN_DICE_LINES, MIN_COMBAT_LINES, MIN_LEVEL_LINES
+    
+    # Long ASCII sections get every line's digit count in one vectorized pass
+    digit_counts = None
+    if len(lines) > NUMPY_LINE_THRESHOLD and content.isascii():
+        digit_counts = ascii_line_digit_counts(content)
+    
     for i, line in enumerate(lines):
         line = line.strip()
         if not line:
             continue
-            
-        # Check for multiple columns separated by spaces/tabs
-        tokens = line.split()
+        
+        digits = digit_counts[i] if digit_counts is not None else None
+        
+        # Check for multiple columns separated by spaces/tabs (not needed
+        # with fewer than 2 digits, which can't make 2 numeric tokens)
+        tokens = line.split() if digits is None or digits >= 2 else ()
         if len(tokens) >= 3:
-            # Check if it has numbers or structured data
-            numeric_tokens = sum(1 for token in tokens if any(c.isdigit() for c in token))
+            # Check if it has numbers or structured data (ASCII lines are
+            # searched in C; others keep str.isdigit's Unicode digits)
+            if line.isascii():
+                numeric_tokens = sum(1 for token in tokens if _ASCII_DIGIT(token))
+            else:
+                numeric_tokens = sum(1 for token in tokens if any(c.isdigit() for c in token))
             if numeric_tokens >= 2:
-                tabular_lines.append({
-                    'line_number': i,
-                    'content': line,
-                    'tokens': tokens,
-                    'numeric_tokens': numeric_tokens
-                })
-    
+                tabular_lines.append(i)
+        
+        if not (_HAS_DIGIT(line) if digits is None else digits):
+            if heading_search(line):
+                level_lines.append(i)
+                if len(level_lines) == level_cap:
+                    level_search = heading_search = _no_match
+            continue
+        
+        if dice_search(line):
+            dice_table_lines.append(i)
+            if len(dice_table_lines) == dice_cap:
+                dice_search = _no_match
+        if combat_search(line):
+            combat_lines.append(i)
+            if len(combat_lines) == combat_cap:
+                combat_search = _no_match
+        if level_search(line):
+            level_lines.append(i)
+            if len(level_lines) == level_cap:
+                level_search = heading_search = _no_match
+    
+    # Pattern 1: Tabular data (multiple columns with alignment)
     if len(tabular_lines) >= 3:  # At least 3 rows of tabular data
         analysis['likely_tables'].append({
             'type': 'aligned_columns',
-            'start_line': tabular_lines[0]['line_number'],
-            'end_line': tabular_lines[-1]['line_number'],
+            'start_line': tabular_lines[0],
+            'end_line': tabular_lines[-1],
             'row_count': len(tabular_lines)
         })
         analysis['table_count'] += 1
         analysis['patterns_found'].append('aligned_columns')
     
-    # Pattern 2: Look for dice roll tables (d20, d100, etc.)
-    dice_patterns = [
-        r'\bd\d+\b',  # d20, d100, etc.
-        r'\d+-\d+',   # ranges like 01-05, 15-20
-        r'\d+\s*-\s*\d+',  # spaced ranges
-    ]
-    
-    dice_table_lines = []
-    for i, line in enumerate(lines):
-        for pattern in dice_patterns:
-            if re.search(pattern, line):
-                dice_table_lines.append(i)
-                break
-    
-    if len(dice_table_lines) >= 5:  # At least 5 lines with dice patterns
+    # Pattern 2: Dice roll tables (d20, d100, etc.)
+    if len(dice_table_lines) >= MIN_DICE_LINES:  # At least 5 lines with dice patterns
         analysis['likely_tables'].append({
             'type': 'dice_table',
             'lines_with_dice': len(dice_table_lines),
@@ -152,22 +396,7 @@ def analyze_section_for_tables(content: str, indicators: List[str]) -> Dict:
         analysis['patterns_found'].append('dice_table')
     
     # Pattern 3: Combat tables (AC, THAC0, etc.)
-    combat_patterns = [
-        r'AC\s*\d+',
-        r'THAC0\s*\d+',
-        r'\d+\s*or\s*better',
-        r'Level\s*\d+',
-        r'HD\s*\d+'
-    ]
-    
-    combat_lines = []
-    for i, line in enumerate(lines):
-        for pattern in combat_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
-                combat_lines.append(i)
-                break
-    
-    if len(combat_lines) >= 3:
+    if len(combat_lines) >= MIN_COMBAT_LINES:
         analysis['likely_tables'].append({
             'type': 'combat_table',
             'combat_lines': len(combat_lines)
@@ -176,24 +405,7 @@ def analyze_section_for_tables(content: str, indicators: List[str]) -> Dict:
         analysis['patterns_found'].append('combat_table')
     
     # Pattern 4: Level progression tables
-    level_patterns = [
-        r'Level\s*\d+',
-        r'\d+st\s+Level',
-        r'\d+nd\s+Level', 
-        r'\d+rd\s+Level',
-        r'\d+th\s+Level',
-        r'Experience\s*Points?',
-        r'XP\s*Required'
-    ]
-    
-    level_lines = []
-    for i, line in enumerate(lines):
-        for pattern in level_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
-                level_lines.append(i)
-                break
-    
-    if len(level_lines) >= 4:
+    if len(level_lines) >= MIN_LEVEL_LINES:
         analysis['likely_tables'].append({
             'type': 'level_table',
             'level_lines': len(level_lines)
@@ -209,64 +421,154 @@ def analyze_section_for_tables(content: str, indicators: List[str]) -> Dict:
         confidence += len(analysis['patterns_found']) * 5  # Bonus for pattern diversity
         
         # Bonus for specific AD&D indicators
-        ad_d_indicators = ['THAC0', 'Armor Class', 'Hit Dice', 'Saving Throw']
-        for indicator in indicators:
-            if indicator in ad_d_indicators:
-                confidence += 10
+        confidence += 10 * sum(1 for indicator in indicators if indicator in _AD_D_INDICATORS)
     
     analysis['confidence'] = min(100, confidence)
     
     return analysis
 
-def extract_better_tables(json_file: str, output_file: str = None):
-    """Re-extract tables with better detection for AD&D content"""
+def check_stream_support(stream: bool) -> bool:
+    """Streaming needs ijson; warn and load whole files without it"""
+    if stream and not IJSON_AVAILABLE:
+        print("⚠️  ijson not installed, loading the whole file (pip install ijson)")
+        return False
+    return stream
+
+def stream_json_items(json_file: str, prefix: str) -> Iterator[Any]:
+    """Decode the items under prefix (e.g. 'sections.item') one at a time with ijson"""
+    with open(json_file, 'rb') as f:
+        yield from ijson.items(f, prefix, use_float=True)
+
+def dump_json(obj: Any, indent: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON, indented by 2 spaces if indent"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+def extract_better_tables(json_file: str, output_file: str = None, stream: bool = False,
+                          analysis_cache: Optional[Dict[int, Dict]] = None,
+                          require_indicators: bool = True):
+    """
+    Re-extract tables with better detection for AD&D content
+    
+    With stream, sections are decoded, improved and written one at a time
+    (keeping the metadata and sections of the input), and a summary with
+    the metadata and counts is returned instead of the whole document.
+    Sections already analyzed by analyze_extracted_content on the same file
+    are looked up in its analysis_cache instead of being analyzed again.
+    With require_indicators, like the analysis, only sections containing a
+    table indicator are analyzed; the rest keep their tables.
+    """
     
     print(f"🔧 Re-extracting tables with improved detection...")
     
+    if analysis_cache is None:
+        analysis_cache = {}
+    
+    if check_stream_support(stream):
+        return extract_better_tables_streamed(json_file, output_file, analysis_cache,
+                                              require_indicators)
+    
     with open(json_file, 'r', encoding='utf-8') as f:
         data = json.load(f)
     
     sections = data.get('sections', [])
     total_tables_found = 0
     
-    for section in sections:
-        content = section.get('content', '')
-        
-        # Use our improved table analysis
-        table_analysis = analyze_section_for_tables(content, [])
-        
-        if table_analysis['likely_tables']:
-            # Extract the actual table data
-            extracted_tables = []
-            
-            for table_info in table_analysis['likely_tables']:
-                if table_info['type'] == 'aligned_columns':
-                    table_data = extract_aligned_table(content, table_info)
-                elif table_info['type'] == 'dice_table':
-                    table_data = extract_dice_table(content)
-                elif table_info['type'] == 'combat_table':
-                    table_data = extract_combat_table(content)
-                elif table_info['type'] == 'level_table':
-                    table_data = extract_level_table(content)
-                else:
-                    table_data = None
-                
-                if table_data:
-                    extracted_tables.append(table_data)
-            
-            section['tables'] = extracted_tables
-            total_tables_found += len(extracted_tables)
+    for i, section in enumerate(sections):
+        total_tables_found += improve_section_tables(section, analysis_cache.get(i),
+                                                     require_indicators)
     
     print(f"✅ Found {total_tables_found} tables with improved detection")
     
     # Save updated data
     if output_file:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            f.write(dump_json(data, indent=True))
         print(f"💾 Saved updated data to: {output_file}")
     
     return data
 
+def extract_better_tables_streamed(json_file: str, output_file: str = None,
+                                   analysis_cache: Optional[Dict[int, Dict]] = None,
+                                   require_indicators: bool = True) -> Dict:
+    """Re-extract tables section by section, writing each section as it is done"""
+    if analysis_cache is None:
+        analysis_cache = {}
+    
+    metadata = next(stream_json_items(json_file, 'metadata'), {})
+    total_sections = 0
+    total_tables_found = 0
+    
+    out = open(output_file, 'wb') if output_file else None
+    try:
+        if out:
+            out.write(b'{"metadata": ' + dump_json(metadata) + b', "sections": [')
+        
+        for i, section in enumerate(stream_json_items(json_file, 'sections.item')):
+            total_tables_found += improve_section_tables(section, analysis_cache.get(i),
+                                                         require_indicators)
+            if out:
+                out.write(b',\n' if total_sections else b'\n')
+                out.write(dump_json(section))
+            total_sections += 1
+        
+        if out:
+            out.write(b'\n]}\n')
+    finally:
+        if out:
+            out.close()
+    
+    print(f"✅ Found {total_tables_found} tables with improved detection")
+    if output_file:
+        print(f"💾 Saved updated data to: {output_file}")
+    
+    return {
+        'metadata': metadata,
+        'total_sections': total_sections,
+        'total_tables': total_tables_found
+    }
+
+def improve_section_tables(section: Dict, table_analysis: Optional[Dict] = None,
+                           require_indicators: bool = True) -> int:
+    """
+    Replace a section's tables with improved detection (reusing
+    table_analysis if the section was already analyzed, and skipping it
+    without table indicators if require_indicators); returns the table count
+    """
+    content = section.get('content', '')
+    
+    # Use our improved table analysis
+    if table_analysis is None:
+        if require_indicators and not has_table_indicator(content):
+            return 0
+        table_analysis = analyze_section_for_tables(content, [], exact_counts=False)
+    
+    if not table_analysis['likely_tables']:
+        return 0
+    
+    # Extract the actual table data
+    extracted_tables = []
+    
+    for table_info in table_analysis['likely_tables']:
+        if table_info['type'] == 'aligned_columns':
+            table_data = extract_aligned_table(content, table_info)
+        elif table_info['type'] == 'dice_table':
+            table_data = extract_dice_table(content)
+        elif table_info['type'] == 'combat_table':
+            table_data = extract_combat_table(content)
+        elif table_info['type'] == 'level_table':
+            table_data = extract_level_table(content)
+        else:
+            table_data = None
+        
+        if table_data:
+            extracted_tables.append(table_data)
+    
+    section['tables'] = extracted_tables
+    return len(extracted_tables)
+
 def extract_aligned_table(content: str, table_info: Dict) -> Dict:
     """Extract aligned column table"""
     lines = content.split('\n')
@@ -294,18 +596,8 @@ def extract_aligned_table(content: str, table_info: Dict) -> Dict:
 
 def extract_dice_table(content: str) -> Dict:
     """Extract dice roll table"""
-    lines = content.split('\n')
-    dice_rows = []
-    
-    dice_pattern = r'(\d+[-–]\d+|\d+)\s+(.+)'
-    
-    for line in lines:
-        line = line.strip()
-        match = re.search(dice_pattern, line)
-        if match:
-            roll_range = match.group(1)
-            result = match.group(2)
-            dice_rows.append([roll_range, result])
+    dice_rows = [[match.group(1), match.group(2).rstrip()]
+                 for match in _DICE_ROW.finditer(content)]
     
     if len(dice_rows) >= 3:
         return {
@@ -345,6 +637,12 @@ def main():
     parser.add_argument("--extract", action="store_true", 
                        help="Re-extract tables with better detection")
     parser.add_argument("-o", "--output", help="Output file for improved extraction")
+    parser.add_argument("--all-sections", action="store_true",
+                       help="Also re-extract tables from sections without table indicators")
+    parser.add_argument("--workers", "-w", type=int, default=1,
+                       help="Worker processes for analyzing sections (default: 1)")
+    parser.add_argument("--stream", action="store_true",
+                       help="Decode sections one at a time with ijson to keep memory flat")
     
     args = parser.parse_args()
     
@@ -353,12 +651,17 @@ def main():
         print(f"❌ File not found: {json_path}")
         return
     
-    # Analyze content
-    potential_tables = analyze_extracted_content(str(json_path))
+    # Analyze content, keeping each section's analysis for the extract pass
+    analysis_cache = {}
+    potential_tables = analyze_extracted_content(str(json_path), stream=args.stream,
+                                                 analysis_cache=analysis_cache,
+                                                 workers=args.workers)
     
     if args.extract:
         output_file = args.output or str(json_path.parent / "improved_extraction.json")
-        improved_data = extract_better_tables(str(json_path), output_file)
+        improved_data = extract_better_tables(str(json_path), output_file, stream=args.stream,
+                                              analysis_cache=analysis_cache,
+                                              require_indicators=not args.all_sections)
         
         print(f"\n🎯 IMPROVEMENT SUMMARY:")
         print("Run the analysis again on the improved file to see the difference!")
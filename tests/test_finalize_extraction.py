@@ -0,0 +1,103 @@
+"""
+Finalize Extraction Tests.
+
+This module tests the archive finalize_extraction script's database outputs:
+- Direct MongoDB inserts with --direct-mongo
+- Stable _ids on the tables collection file
+
+Priority: 2 (Essential Integration & Workflow)
+"""
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+ARCHIVE_DIR = Path(__file__).parent.parent / "archive"
+
+
+@pytest.fixture
+def finalize_module():
+    """Load archive/finalize_extraction.py as a module"""
+    spec = importlib.util.spec_from_file_location(
+        "finalize_extraction", ARCHIVE_DIR / "finalize_extraction.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def improved_json(temp_dir):
+    """A small improved extraction with tables on two sections"""
+    data = {
+        "metadata": {"edition": "1st Edition", "book_type": "DMG", "original_filename": "dmg.pdf"},
+        "sections": [
+            {
+                "page": 1,
+                "title": "Random Encounters",
+                "content": "Roll d100 on the table below",
+                "category": "Tables",
+                "tables": [
+                    {"type": "dice_table", "headers": ["Roll", "Result"],
+                     "rows": [["01-50", "Orcs"], ["51-00", "Goblins"]]},
+                    {"type": "general", "headers": ["Name"], "rows": [["Sword"]]}
+                ]
+            },
+            {"page": 2, "title": "Treasure", "content": "No tables here"},
+            {
+                "page": 3,
+                "title": "Combat",
+                "content": "Attack matrix",
+                "tables": [{"type": "combat_table", "headers": ["AC", "Roll"], "rows": [["5", "12"]]}]
+            }
+        ]
+    }
+    path = temp_dir / "improved_extraction.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+@pytest.mark.priority2
+@pytest.mark.unit
+@pytest.mark.mock
+class TestDirectMongoOutput:
+    """Test finalizing straight into a MongoDB collection"""
+
+    def _run_direct_mongo(self, finalize_module, improved_json, *extra_args):
+        manager = MagicMock()
+        manager.connected = True
+        manager.bulk_write.side_effect = lambda collection, operations: {
+            'success': True, 'inserted': len(operations)
+        }
+
+        argv = ["finalize_extraction.py", str(improved_json), "--direct-mongo", "add_dmg", *extra_args]
+        with patch.object(finalize_module, "MONGODB_AVAILABLE", True), \
+                patch.object(finalize_module, "MongoDBManager", return_value=manager), \
+                patch.object(sys, "argv", argv):
+            finalize_module.main()
+
+        inserted = [op._doc for call in manager.bulk_write.call_args_list for op in call.args[1]]
+        tables_file = improved_json.parent / "tables_collection.jsonl"
+        tables = [json.loads(line) for line in tables_file.read_text(encoding="utf-8").splitlines()]
+        return inserted, tables
+
+    def test_tables_file_keeps_string_ids(self, finalize_module, improved_json):
+        """Test the tables file keeps its _ids for mongoimport while sections get ObjectIds"""
+        inserted, tables = self._run_direct_mongo(finalize_module, improved_json)
+
+        assert len(inserted) == 3
+        assert all("_id" not in doc for doc in inserted)
+        assert not (improved_json.parent / "mongodb_final.jsonl").exists()
+
+        assert [table["_id"] for table in tables] == ["table_0_0", "table_0_1", "table_2_0"]
+
+    def test_deterministic_ids_flag(self, finalize_module, improved_json):
+        """Test --deterministic-ids gives the inserted sections string _ids"""
+        inserted, tables = self._run_direct_mongo(finalize_module, improved_json, "--deterministic-ids")
+
+        assert [doc["_id"] for doc in inserted] == ["dmg_page_1_0", "dmg_page_2_1", "dmg_page_3_2"]
+        assert [table["_id"] for table in tables] == ["table_0_0", "table_0_1", "table_2_0"]
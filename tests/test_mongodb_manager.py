@@ -18,7 +18,9 @@ from pathlib import Path
 import pymongo
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError, DuplicateKeyError
 
-from Modules.mongodb_manager import MongoDBManager
+from Modules.mongodb_manager import (
+    MongoDBManager, MONGODB_MAX_POOL_SIZE, MONGODB_MIN_POOL_SIZE, MONGODB_MAX_IDLE_TIME_MS
+)
 
 
 class TestConnectionManagement:
@@ -93,6 +95,31 @@ class TestConnectionManagement:
                 manager = MongoDBManager(config)
                 assert manager is not None
 
+    def test_connection_pool_settings(self):
+        """Test the client is created with a tuned connection pool"""
+        with patch('Modules.mongodb_manager.MongoClient') as mock_client:
+            mock_client.return_value.admin.command.return_value = {"ok": 1}
+
+            manager = MongoDBManager(debug=False)
+
+            assert manager.connected is True
+            kwargs = mock_client.call_args[1]
+            assert kwargs["maxPoolSize"] == MONGODB_MAX_POOL_SIZE
+            assert kwargs["minPoolSize"] == MONGODB_MIN_POOL_SIZE
+            assert kwargs["maxIdleTimeMS"] == MONGODB_MAX_IDLE_TIME_MS
+            assert kwargs["retryWrites"] is True
+
+    def test_wire_compression_falls_back_to_installed_compressors(self):
+        """Test unavailable compressors are dropped without warnings"""
+        with patch('Modules.mongodb_manager.MongoClient') as mock_client:
+            mock_client.return_value.admin.command.return_value = {"ok": 1}
+
+            MongoDBManager(debug=False)
+
+            compressors = mock_client.call_args[1]["compressors"].split(",")
+            assert "zlib" in compressors
+            assert set(compressors) <= {"zstd", "snappy", "zlib"}
+
     def test_database_selection(self, mock_mongodb_config):
         """Test database selection and access"""
         with patch('pymongo.MongoClient') as mock_client:
@@ -349,12 +376,29 @@ class TestDocumentOperations:
 class TestIndexManagement:
     """Test index creation and management"""
 
-    @pytest.mark.skip(reason="create_index method not implemented in actual MongoDBManager")
     def test_create_index(self, mock_mongodb_config):
         """Test creating an index on a collection"""
-        # Note: This test is skipped because the actual MongoDBManager doesn't have create_index method
-        # The actual interface focuses on content import and querying
-        pass
+        with patch.object(MongoDBManager, '_connect', return_value=True):
+            manager = MongoDBManager(debug=False)
+        manager.database = MagicMock()
+        manager.connected = True
+        collection = manager.database.__getitem__.return_value
+        collection.create_index.return_value = "metadata.enhanced_1_metadata.quality_score_1"
+        keys = [("metadata.enhanced", 1), ("metadata.quality_score", 1)]
+
+        result = manager.create_index("test_collection", keys)
+
+        collection.create_index.assert_called_once_with(keys)
+        assert result == {
+            "success": True,
+            "index_name": "metadata.enhanced_1_metadata.quality_score_1"
+        }
+
+        collection.create_index.side_effect = Exception("not authorized")
+        result = manager.create_index("test_collection", keys)
+
+        assert result["success"] is False
+        assert "not authorized" in result["error"]
 
     @pytest.mark.skip(reason="list_indexes method not implemented in actual MongoDBManager")
     def test_list_indexes(self, mock_mongodb_config):
@@ -431,3 +475,120 @@ class TestErrorHandling:
 
             with pytest.raises(ConnectionFailure):
                 manager.insert_document("test_collection", document)
+
+
+class TestBulkOperations:
+    """Test batched read and write operations"""
+
+    def _connected_manager(self):
+        with patch.object(MongoDBManager, '_connect', return_value=True):
+            manager = MongoDBManager(debug=False)
+        manager.database = MagicMock()
+        manager.connected = True
+        return manager
+
+    def test_bulk_write_unordered(self):
+        """Test operations are sent in one unordered bulk write"""
+        manager = self._connected_manager()
+        collection = manager.database.__getitem__.return_value
+        collection.bulk_write.return_value = Mock(
+            matched_count=2, modified_count=2, inserted_count=0, upserted_count=0
+        )
+        operations = [
+            pymongo.UpdateOne({"_id": 1}, {"$set": {"content": "a"}}),
+            pymongo.UpdateOne({"_id": 2}, {"$set": {"content": "b"}})
+        ]
+
+        result = manager.bulk_write("test_collection", operations)
+
+        collection.bulk_write.assert_called_once_with(operations, ordered=False)
+        assert result["success"] is True
+        assert result["modified"] == 2
+
+    def test_bulk_write_empty_operations(self):
+        """Test an empty operation list skips the round trip"""
+        manager = self._connected_manager()
+
+        result = manager.bulk_write("test_collection", [])
+
+        manager.database.__getitem__.assert_not_called()
+        assert result["success"] is True
+        assert result["modified"] == 0
+
+    def test_bulk_write_not_connected(self):
+        """Test bulk write reports an error when disconnected"""
+        with patch.object(MongoDBManager, '_connect', return_value=False):
+            manager = MongoDBManager(debug=False)
+
+        result = manager.bulk_write("test_collection", [Mock()])
+
+        assert result["success"] is False
+
+    def test_bulk_write_error_handling(self):
+        """Test server errors are reported instead of raised"""
+        manager = self._connected_manager()
+        collection = manager.database.__getitem__.return_value
+        collection.bulk_write.side_effect = pymongo.errors.BulkWriteError({"writeErrors": []})
+
+        result = manager.bulk_write("test_collection", [Mock()])
+
+        assert result["success"] is False
+        assert "Bulk write failed" in result["error"]
+
+    def test_bulk_write_partial_failure(self):
+        """Test counts of the applied operations are kept when some fail"""
+        manager = self._connected_manager()
+        collection = manager.database.__getitem__.return_value
+        collection.bulk_write.side_effect = pymongo.errors.BulkWriteError({
+            "writeErrors": [{"index": 1, "code": 11000, "errmsg": "duplicate key"}],
+            "nInserted": 2, "nMatched": 0, "nModified": 0, "nUpserted": 0
+        })
+
+        result = manager.bulk_write("test_collection", [Mock(), Mock(), Mock()])
+
+        assert result["success"] is False
+        assert result["error"] == "Bulk write failed: 1 operations failed"
+        assert result["inserted"] == 2
+
+    def test_update_many_pipeline(self):
+        """Test a pipeline update is applied server-side in one call"""
+        manager = self._connected_manager()
+        collection = manager.database.__getitem__.return_value
+        collection.update_many.return_value = Mock(matched_count=3, modified_count=3)
+        query = {"content": {"$regex": "isthe"}}
+        pipeline = [{"$set": {"content": {"$replaceAll": {
+            "input": "$content", "find": "isthe", "replacement": "is the"}}}}]
+
+        result = manager.update_many("test_collection", query, pipeline)
+
+        collection.update_many.assert_called_once_with(query, pipeline)
+        assert result == {"success": True, "matched": 3, "modified": 3}
+
+    def test_update_many_error_handling(self):
+        """Test update errors are reported instead of raised"""
+        manager = self._connected_manager()
+        collection = manager.database.__getitem__.return_value
+        collection.update_many.side_effect = pymongo.errors.OperationFailure("Unrecognized expression")
+
+        result = manager.update_many("test_collection", {}, [])
+
+        assert result["success"] is False
+        assert "Unrecognized expression" in result["error"]
+
+    def test_find_cursor_streams_in_batches(self):
+        """Test find_cursor opens a batched, non-expiring cursor with projection"""
+        manager = self._connected_manager()
+        collection = manager.database.__getitem__.return_value
+
+        cursor = manager.find_cursor("test_collection", {"game": "dnd"}, {"content": 1}, batch_size=50)
+
+        collection.find.assert_called_once_with({"game": "dnd"}, {"content": 1}, no_cursor_timeout=True)
+        collection.find.return_value.batch_size.assert_called_once_with(50)
+        assert cursor == collection.find.return_value.batch_size.return_value
+
+    def test_find_cursor_not_connected(self):
+        """Test find_cursor returns None when disconnected"""
+        with patch.object(MongoDBManager, '_connect', return_value=False):
+            manager = MongoDBManager(debug=False)
+
+        assert manager.find_cursor("test_collection") is None
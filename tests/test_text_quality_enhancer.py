@@ -13,7 +13,9 @@ Priority: 2 (Essential Integration & Workflow)
 
 import pytest
 from unittest.mock import Mock, patch
-from Modules.text_quality_enhancer import TextQualityEnhancer, QualityMetrics, TextCleanupResult
+from Modules.text_quality_enhancer import (
+    TextQualityEnhancer, QualityMetrics, TextCleanupResult, _TEXT_ISSUE_PATTERNS
+)
 
 
 @pytest.mark.priority2
@@ -307,6 +309,39 @@ class TestQualityAssessment:
         assert 0 <= readable_score <= 100
         assert 0 <= unreadable_score <= 100
 
+    def test_issue_scan_detects_each_pattern(self):
+        """Test the single-pass issue scan reports every matching pattern in order"""
+        enhancer = TextQualityEnhancer()
+
+        assert enhancer._scan_text_issues("Fireball.") == []
+        assert enhancer._scan_text_issues("Fireball “Dragon”") == [
+            "Smart quotes/apostrophes detected"
+        ]
+        assert enhancer._scan_text_issues("Fireball   ‘Dragon’ w i z a r d") == [
+            "Excessive whitespace detected",
+            "Spaced letters within words (OCR artifact)",
+            "Smart quotes/apostrophes detected"
+        ]
+
+    def test_issue_scan_matches_re_on_unusual_characters(self):
+        """Test the issue scan agrees with re on Python-only whitespace and lone surrogates"""
+        enhancer = TextQualityEnhancer()
+
+        texts = [
+            "wizard\x1cdragon",           # \x1c-\x1f are whitespace for str
+            "Fireball\x1d\x1e\x1fspell",
+            "Fireball\x85\xa0　spell",
+            "Page text \ud835 with a lone surrogate   and “quotes”",
+            "w\ud800 i\x1fz"
+        ]
+
+        for text in texts:
+            expected = [label for pattern, label in _TEXT_ISSUE_PATTERNS if pattern.search(text)]
+            assert enhancer._scan_text_issues(text) == expected
+
+        metrics = enhancer._assess_text_quality("Page text \ud835 with a lone surrogate")
+        assert isinstance(metrics, QualityMetrics)
+
     def test_grade_assignment(self):
         """Test grade assignment based on scores"""
         enhancer = TextQualityEnhancer()